@@ -4,9 +4,10 @@
 라디오 오디오 스트리밍 및 재생 제어 API
 """
 
-from typing import Optional
+from typing import Optional, Tuple
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, Query, Header, Response
 from fastapi.responses import JSONResponse
 
 from app.models.audio import (
@@ -42,21 +43,39 @@ def audio_error_response(code: str, message: str, status_code: int = 400):
     )
 
 
-@router.get("/stream/{script_id}", response_model=StreamResponse)
-async def get_stream(
-    script_id: UUID,
-    quality: str = Query(default="medium", regex="^(low|medium|high)$"),
-    format: str = Query(default="hls", regex="^(hls|mp3)$"),
-    current_user: Optional[User] = Depends(get_current_user),
-    audio_service: AudioService = Depends(get_audio_service_dep)
-):
+def stream_etag(stream_info: StreamResponse) -> str:
     """
-    오디오 스트림 URL 및 메타데이터 조회
+    스트림 정보 ETag 생성
     
-    - **script_id**: 스크립트 ID
-    - **quality**: 오디오 품질 (low, medium, high)
-    - **format**: 스트리밍 형식 (hls, mp3)
+    cached/expires_at 처럼 캐시 상태에 따라 바뀌는 필드는 제외하므로
+    본문이 완전히 같지는 않아 약한(W/) ETag를 사용합니다.
     """
+    key = f"{stream_info.stream_url}|{stream_info.duration}|{stream_info.bitrate}|{stream_info.format}"
+    return f'W/"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """If-None-Match 헤더와 ETag 비교 (약한 비교)"""
+    if not if_none_match:
+        return False
+    
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+async def resolve_stream(
+    audio_service: AudioService,
+    script_id: UUID,
+    quality: str,
+    current_user: Optional[User]
+) -> Tuple[StreamResponse, str]:
+    """스트림 정보와 ETag 조회 (GET/HEAD 공통, 서비스 예외는 HTTP 에러로 변환)"""
     try:
         user_id = current_user.id if current_user else None
         stream_info = await audio_service.get_stream_info(
@@ -64,7 +83,7 @@ async def get_stream(
             quality=quality,
             user_id=user_id
         )
-        return stream_info
+        return stream_info, stream_etag(stream_info)
     
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -74,6 +93,50 @@ async def get_stream(
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
+@router.get("/stream/{script_id}", response_model=StreamResponse)
+async def get_stream(
+    script_id: UUID,
+    response: Response,
+    quality: str = Query(default="medium", regex="^(low|medium|high)$"),
+    format: str = Query(default="hls", regex="^(hls|mp3)$"),
+    if_none_match: Optional[str] = Header(default=None),
+    current_user: Optional[User] = Depends(get_current_user),
+    audio_service: AudioService = Depends(get_audio_service_dep)
+):
+    """
+    오디오 스트림 URL 및 메타데이터 조회
+    
+    - **script_id**: 스크립트 ID
+    - **quality**: 오디오 품질 (low, medium, high)
+    - **format**: 스트리밍 형식 (hls, mp3)
+    
+    응답에 ETag를 포함하며, If-None-Match가 일치하면 본문 없이 304를 반환합니다.
+    """
+    stream_info, etag = await resolve_stream(audio_service, script_id, quality, current_user)
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    response.headers["ETag"] = etag
+    return stream_info
+
+
+@router.head("/stream/{script_id}")
+async def head_stream(
+    script_id: UUID,
+    quality: str = Query(default="medium", regex="^(low|medium|high)$"),
+    format: str = Query(default="hls", regex="^(hls|mp3)$"),
+    if_none_match: Optional[str] = Header(default=None),
+    current_user: Optional[User] = Depends(get_current_user),
+    audio_service: AudioService = Depends(get_audio_service_dep)
+):
+    """
+    오디오 스트림 상태 확인 (본문 없이 상태 코드와 ETag만 반환)
+    """
+    _, etag = await resolve_stream(audio_service, script_id, quality, current_user)
+    status_code = 304 if etag_matches(etag, if_none_match) else 200
+    return Response(status_code=status_code, headers={"ETag": etag})
+
+
 @router.post("/prepare/{script_id}", response_model=PrepareResponse)
 async def prepare_audio(
     script_id: UUID,
@@ -100,6 +163,7 @@ async def prepare_audio(
 @router.post("/play", response_model=PlayResponse)
 async def start_playback(
     request: PlayRequest,
+    response: Response,
     current_user: User = Depends(get_current_user),
     audio_service: AudioService = Depends(get_audio_service_dep)
 ):
@@ -107,6 +171,8 @@ async def start_playback(
     재생 시작 및 세션 생성
     
     새로운 재생 세션을 생성하고 스트림 URL을 반환합니다.
+    생성된 세션 ID는 X-Session-Id 헤더로도 전달합니다.
+    (세션 단건 조회 엔드포인트가 없으므로 Location 헤더는 사용하지 않음)
     """
     try:
         play_response = await audio_service.create_play_session(
@@ -115,6 +181,8 @@ async def start_playback(
             position=request.position,
             sentence_id=request.sentence_id
         )
+        
+        response.headers["X-Session-Id"] = str(play_response.session_id)
         return play_response
     
     except ValueError as e:
@@ -28,6 +28,15 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/sync", tags=["sync"])
 
 
+def validate_time_range(start_time: float, end_time: float) -> None:
+    """매핑 시간 범위 검사 (시작 시간 < 종료 시간)"""
+    if start_time >= end_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작 시간은 종료 시간보다 작아야 합니다."
+        )
+
+
 # =============================================================================
 # 문장 매핑 CRUD 엔드포인트
 # =============================================================================
@@ -50,11 +59,7 @@ async def create_sentence_mapping(
         sync_service = get_sync_mapping_service()
         
         # 시간 유효성 검사
-        if mapping_data.start_time >= mapping_data.end_time:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="시작 시간은 종료 시간보다 작아야 합니다."
-            )
+        validate_time_range(mapping_data.start_time, mapping_data.end_time)
         
         # 매핑 생성
         mapping = await sync_service.create_sentence_mapping(
@@ -68,6 +73,8 @@ async def create_sentence_mapping(
         
         return SentenceMappingResponse(**mapping)
         
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.warning(f"Invalid mapping data: {str(e)}")
         raise HTTPException(
@@ -142,11 +149,7 @@ async def update_sentence_mapping(
         mapping_type = mapping_update.mapping_type.value if mapping_update.mapping_type else existing_mapping['mapping_type']
         
         # 시간 유효성 검사
-        if start_time >= end_time:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="시작 시간은 종료 시간보다 작아야 합니다."
-            )
+        validate_time_range(start_time, end_time)
         
         # 매핑 업데이트
         updated_mapping = await sync_service.update_sentence_mapping(
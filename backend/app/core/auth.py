@@ -41,7 +41,7 @@ async def verify_jwt_token(token: str) -> Optional[dict]:
     except jwt.ExpiredSignatureError:
         logger.warning("JWT token expired")
         return None
-    except jwt.JWTError as e:
+    except jwt.PyJWTError as e:
         logger.warning(f"JWT validation failed: {str(e)}")
         return None
     except Exception as e:
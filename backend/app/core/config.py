@@ -4,7 +4,8 @@
 
 import os
 from typing import Optional, List
-from pydantic import BaseSettings, Field, validator
+from pydantic import Field, validator
+from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
@@ -50,6 +51,7 @@ class Settings(BaseSettings):
     SUPABASE_URL: str = Field(..., description="Supabase 프로젝트 URL")
     SUPABASE_ANON_KEY: str = Field(..., description="Supabase 익명 키")
     SUPABASE_SERVICE_KEY: Optional[str] = Field(None, description="Supabase 서비스 키 (관리자용)")
+    DATABASE_URL: Optional[str] = Field(None, description="PostgreSQL 직접 연결 URL (스키마 검증 등)")
     
     # JWT 설정
     JWT_SECRET_KEY: str = Field(..., description="JWT 토큰 서명용 비밀 키")
@@ -239,7 +239,13 @@ class WebSocketMessageType(str, Enum):
     POSITION_UPDATE = "position_update"      # 위치 업데이트
     SESSION_JOIN = "session_join"            # 세션 참가
     SESSION_LEAVE = "session_leave"          # 세션 나가기
+    PARTICIPANTS_CHANGED = "participants_changed"  # 참가/퇴장 묶음 알림
     SYNC_STATE = "sync_state"               # 동기화 상태
+    CONNECTION_ACK = "connection_ack"        # 연결 확인
+    POSITION_SYNC = "position_sync"          # 위치 동기화 브로드캐스트
+    MAPPING_EDIT = "mapping_edit"            # 매핑 편집
+    PING = "ping"                           # 연결 유지 확인
+    PONG = "pong"                           # Ping 응답
     ERROR = "error"                         # 오류
 
 
@@ -267,6 +273,21 @@ class WebSocketMessage(BaseModel):
     )
 
 
+class PositionUpdateData(BaseModel):
+    """수신 재생 위치 업데이트 데이터"""
+    position: float = Field(0.0, description="재생 위치 (초)", ge=0)
+    is_playing: bool = Field(False, description="재생 중 여부")
+    sentence_id: Optional[str] = Field(None, description="현재 문장 ID")
+
+
+class MappingEditData(BaseModel):
+    """수신 매핑 편집 데이터"""
+    sentence_id: Optional[str] = Field(None, description="문장 ID")
+    start_time: Optional[float] = Field(None, description="시작 시간 (초)", ge=0)
+    end_time: Optional[float] = Field(None, description="종료 시간 (초)", ge=0)
+    edit_type: str = Field("manual", description="편집 유형")
+
+
 # =============================================================================
 # 응답 및 에러 모델
 # =============================================================================
@@ -4,6 +4,7 @@
 단어 검색, 생성, 조회 등 기본적인 단어 관리 기능을 담당합니다.
 """
 
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -40,19 +41,31 @@ class WordService:
             검색 결과 딕셔너리
         """
         try:
-            # 1. 로컬 DB에서 검색
-            local_results = await self._search_local_words(query, search_type, limit)
+            # 1. 로컬 DB 검색과 JMdict API 검색을 동시에 시작
+            # (Supabase 클라이언트는 동기 호출이므로 외부 요청을 먼저 띄워
+            #  로컬 쿼리 동안 네트워크 대기가 겹치도록 함)
+            external_task = asyncio.create_task(
+                self.jmdict.search_words(query, limit)
+            )
+            local_task = asyncio.create_task(
+                self._search_local_words(query, search_type, limit)
+            )
             
-            # 2. JMdict API에서 검색 (로컬 결과가 부족한 경우)
+            try:
+                local_results = await local_task
+            except BaseException:
+                external_task.cancel()
+                raise
+            
+            # 2. 로컬 결과가 충분하면 외부 검색 취소, 부족하면 결과 사용
             external_results = []
-            if len(local_results) < limit // 2:
-                external_results = await self.jmdict.search_words(
-                    query, limit - len(local_results)
-                )
+            if len(local_results) >= limit // 2:
+                external_task.cancel()
+            else:
+                external_results = await external_task
                 
-                # 새로운 단어들을 로컬 DB에 저장
-                for word_data in external_results:
-                    await self._create_word_if_not_exists(word_data)
+                # 새로운 단어들을 로컬 DB에 일괄 저장
+                await self._create_missing_words(external_results)
             
             # 3. 결과 통합 및 중복 제거
             all_results = local_results + external_results
@@ -120,7 +133,12 @@ class WordService:
             return None
     
     async def create_word(self, word_data: Dict[str, Any]) -> Dict[str, Any]:
-        """새 단어 생성"""
+        """
+        새 단어 생성
+
+        같은 텍스트의 단어가 이미 있으면 변경하지 않고 기존 데이터를 반환합니다.
+        (words의 유니크 키는 reading이 NULL이면 충돌하지 않으므로 upsert 대신 텍스트로 조회)
+        """
         try:
             # 중복 체크
             existing = await self.get_word_by_text(word_data["text"])
@@ -129,20 +147,7 @@ class WordService:
                 return existing
             
             # 단어 데이터 준비
-            create_data = {
-                "id": str(uuid4()),
-                "text": word_data["text"],
-                "reading": word_data.get("reading"),
-                "meaning": word_data["meaning"],
-                "part_of_speech": word_data["part_of_speech"],
-                "difficulty_level": word_data.get("difficulty_level", "beginner"),
-                "example_sentence": word_data.get("example_sentence"),
-                "example_translation": word_data.get("example_translation"),
-                "audio_url": word_data.get("audio_url"),
-                "metadata": word_data.get("metadata", {}),
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
-            }
+            create_data = self._build_create_data(word_data)
             
             # DB에 저장
             result = self.db.client.from_("words").insert(create_data).execute()
@@ -196,19 +201,66 @@ class WordService:
             logger.error(f"❌ 로컬 단어 검색 실패: {str(e)}")
             return []
     
-    async def _create_word_if_not_exists(self, word_data: Dict[str, Any]) -> Optional[str]:
-        """단어가 없으면 생성하고 ID 반환"""
+    async def _create_missing_words(self, words: List[Dict[str, Any]]) -> int:
+        """
+        DB에 없는 단어만 일괄 생성
+
+        텍스트 기준으로 중복을 제거한 뒤 한 번의 SELECT로 기존 단어를 확인하고,
+        남은 단어를 한 번의 INSERT로 저장합니다.
+
+        Returns:
+            새로 생성된 단어 수
+        """
         try:
-            existing = await self.get_word_by_text(word_data["text"])
-            if existing:
-                return existing["id"]
+            unique_words = self._deduplicate_words(words)
+            if not unique_words:
+                return 0
+            
+            texts = [word["text"] for word in unique_words]
+            existing = self.db.client.from_("words").select("text").in_(
+                "text", texts
+            ).execute()
+            existing_texts = {row["text"] for row in existing.data or []}
+            
+            now = datetime.utcnow().isoformat()
+            rows = [
+                self._build_create_data(word, now)
+                for word in unique_words
+                if word["text"] not in existing_texts
+            ]
+            if not rows:
+                return 0
             
-            created = await self.create_word(word_data)
-            return created["id"]
+            result = self.db.client.from_("words").insert(rows).execute()
+            created_count = len(result.data or [])
+            logger.info(f"✅ 새 단어 일괄 생성: {created_count}개")
+            return created_count
             
         except Exception as e:
-            logger.error(f"❌ 단어 생성 실패: {str(e)}")
-            return None
+            logger.error(f"❌ 단어 일괄 생성 실패: {str(e)}")
+            return 0
+    
+    def _build_create_data(
+        self,
+        word_data: Dict[str, Any],
+        now: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """words 테이블 INSERT용 데이터 생성 (now: 생성/수정 시각 ISO 문자열)"""
+        now = now or datetime.utcnow().isoformat()
+        return {
+            "id": str(uuid4()),
+            "text": word_data["text"],
+            "reading": word_data.get("reading"),
+            "meaning": word_data["meaning"],
+            "part_of_speech": word_data["part_of_speech"],
+            "difficulty_level": word_data.get("difficulty_level", "beginner"),
+            "example_sentence": word_data.get("example_sentence"),
+            "example_translation": word_data.get("example_translation"),
+            "audio_url": word_data.get("audio_url"),
+            "metadata": word_data.get("metadata", {}),
+            "created_at": now,
+            "updated_at": now
+        }
     
     def _deduplicate_words(self, words: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """단어 결과 중복 제거"""
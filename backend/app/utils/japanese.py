@@ -5,28 +5,72 @@
 """
 
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+
+# 문자 범위 판별용 정규식 (문자 단위 순회를 정규식 엔진에서 처리)
+_HIRAGANA_RE = re.compile(r"[\u3040-\u309F]+")
+_KATAKANA_RE = re.compile(r"[\u30A0-\u30FF]+")
+_KANJI_RE = re.compile(r"[\u4E00-\u9FAF]+")
 
 
 def is_hiragana(text: str) -> bool:
     """텍스트가 히라가나인지 확인"""
     if not text:
         return False
-    return all(0x3040 <= ord(char) <= 0x309F for char in text)
+    return _HIRAGANA_RE.fullmatch(text) is not None
 
 
 def is_katakana(text: str) -> bool:
     """텍스트가 가타카나인지 확인"""
     if not text:
         return False
-    return all(0x30A0 <= ord(char) <= 0x30FF for char in text)
+    return _KATAKANA_RE.fullmatch(text) is not None
 
 
 def is_kanji(text: str) -> bool:
     """텍스트가 한자인지 확인"""
     if not text:
         return False
-    return all(0x4E00 <= ord(char) <= 0x9FAF for char in text)
+    return _KANJI_RE.fullmatch(text) is not None
+
+
+def _analyze(text: str) -> Tuple[Dict[str, int], int]:
+    """
+    텍스트를 한 번 순회하여 문자 유형별 개수와 일본어 문자 수 계산
+
+    일본어 문자 수에는 히라가나, 가타카나, 한자, 일본어 구두점/기호가 포함됩니다.
+    """
+    hiragana = katakana = kanji = ascii_ = other = punctuation = 0
+    
+    for char in text:
+        char_code = ord(char)
+        if 0x3040 <= char_code <= 0x309F:
+            hiragana += 1
+        elif 0x30A0 <= char_code <= 0x30FF:
+            katakana += 1
+        elif 0x4E00 <= char_code <= 0x9FAF:
+            kanji += 1
+        elif char_code <= 0x007F:
+            ascii_ += 1
+        else:
+            other += 1
+            if 0x3000 <= char_code <= 0x303F:  # 일본어 구두점/기호
+                punctuation += 1
+    
+    counts = {
+        "hiragana": hiragana,
+        "katakana": katakana,
+        "kanji": kanji,
+        "ascii": ascii_,
+        "other": other
+    }
+    return counts, hiragana + katakana + kanji + punctuation
+
+
+def _is_japanese_ratio(japanese_chars: int, total_chars: int) -> bool:
+    """50% 이상이 일본어 문자이면 일본어로 판단"""
+    return total_chars > 0 and japanese_chars / total_chars >= 0.5
 
 
 def is_japanese(text: str) -> bool:
@@ -34,52 +78,20 @@ def is_japanese(text: str) -> bool:
     if not text:
         return False
     
-    japanese_chars = 0
-    total_chars = len(text)
-    
-    for char in text:
-        char_code = ord(char)
-        # 히라가나, 가타카나, 한자, 일본어 구두점
-        if (0x3040 <= char_code <= 0x309F or  # 히라가나
-            0x30A0 <= char_code <= 0x30FF or  # 가타카나
-            0x4E00 <= char_code <= 0x9FAF or  # 한자
-            0x3000 <= char_code <= 0x303F):   # 일본어 구두점/기호
-            japanese_chars += 1
-    
-    # 50% 이상이 일본어 문자이면 일본어로 판단
-    return japanese_chars / total_chars >= 0.5
+    _, japanese_chars = _analyze(text)
+    return _is_japanese_ratio(japanese_chars, len(text))
 
 
 def has_kanji(text: str) -> bool:
     """텍스트에 한자가 포함되어 있는지 확인"""
     if not text:
         return False
-    return any(0x4E00 <= ord(char) <= 0x9FAF for char in text)
+    return _KANJI_RE.search(text) is not None
 
 
 def count_character_types(text: str) -> Dict[str, int]:
     """텍스트의 문자 유형별 개수 계산"""
-    counts = {
-        "hiragana": 0,
-        "katakana": 0,
-        "kanji": 0,
-        "ascii": 0,
-        "other": 0
-    }
-    
-    for char in text:
-        char_code = ord(char)
-        if 0x3040 <= char_code <= 0x309F:
-            counts["hiragana"] += 1
-        elif 0x30A0 <= char_code <= 0x30FF:
-            counts["katakana"] += 1
-        elif 0x4E00 <= char_code <= 0x9FAF:
-            counts["kanji"] += 1
-        elif 0x0000 <= char_code <= 0x007F:
-            counts["ascii"] += 1
-        else:
-            counts["other"] += 1
-    
+    counts, _ = _analyze(text)
     return counts
 
 
@@ -145,14 +157,21 @@ def estimate_word_difficulty(word: str) -> str:
     Returns:
         난이도 레벨 (beginner, intermediate, advanced)
     """
-    if not word or not is_japanese(word):
+    if not word:
         return "beginner"
     
-    char_counts = count_character_types(word)
+    char_counts, japanese_chars = _analyze(word)
     total_chars = len(word)
+    if not _is_japanese_ratio(japanese_chars, total_chars):
+        return "beginner"
     
+    return _difficulty_from_counts(char_counts["kanji"], total_chars)
+
+
+def _difficulty_from_counts(kanji_count: int, total_chars: int) -> str:
+    """한자 수와 전체 길이로 난이도 계산"""
     # 히라가나/가타카나만 있는 경우
-    if char_counts["kanji"] == 0:
+    if kanji_count == 0:
         if total_chars <= 3:
             return "beginner"
         elif total_chars <= 6:
@@ -161,7 +180,7 @@ def estimate_word_difficulty(word: str) -> str:
             return "advanced"
     
     # 한자가 포함된 경우
-    kanji_ratio = char_counts["kanji"] / total_chars
+    kanji_ratio = kanji_count / total_chars
     
     if kanji_ratio <= 0.3 and total_chars <= 3:
         return "beginner"
@@ -235,14 +254,15 @@ def validate_japanese_word(word: str) -> Dict[str, Any]:
             result["errors"].append("정규화 후 빈 텍스트입니다")
             return result
         
+        # 문자 유형 분석 (한 번의 순회로 일본어 여부와 난이도까지 계산)
+        char_types, japanese_chars = _analyze(cleaned)
+        result["char_types"] = char_types
+        
         # 일본어 여부 확인
-        result["is_japanese"] = is_japanese(cleaned)
+        result["is_japanese"] = _is_japanese_ratio(japanese_chars, len(cleaned))
         if not result["is_japanese"]:
             result["errors"].append("일본어 텍스트가 아닙니다")
         
-        # 문자 유형 분석
-        result["char_types"] = count_character_types(cleaned)
-        
         # 길이 확인
         if len(cleaned) > 50:
             result["errors"].append("단어가 너무 깁니다 (50자 제한)")
@@ -251,7 +271,10 @@ def validate_japanese_word(word: str) -> Dict[str, Any]:
         result["reading"] = extract_reading_from_text(word)
         
         # 난이도 추정
-        result["estimated_difficulty"] = estimate_word_difficulty(cleaned)
+        if result["is_japanese"]:
+            result["estimated_difficulty"] = _difficulty_from_counts(
+                char_types["kanji"], len(cleaned)
+            )
         
         # 유효성 판단
         result["is_valid"] = len(result["errors"]) == 0
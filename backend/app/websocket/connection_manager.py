@@ -4,9 +4,11 @@ WebSocket 연결 관리자
 클라이언트 연결, 룸 관리, 메시지 브로드캐스트
 """
 
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, List, Set, Optional, Any, Tuple, Iterator
+from dataclasses import dataclass, asdict
 from uuid import UUID
-import json
+import orjson
+import heapq
 import logging
 import asyncio
 from datetime import datetime
@@ -14,10 +16,52 @@ from fastapi import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
 
+# 참가/퇴장 알림 병합 대기 시간 (초)
+ROOM_EVENT_FLUSH_DELAY = 0.05
+
+# 연결별 송신 큐 최대 길이 (초과 시 느린 클라이언트로 보고 연결 해제)
+OUTBOUND_QUEUE_SIZE = 256
+
+
+def serialize_message(message: Dict[str, Any]) -> bytes:
+    """
+    WebSocket 메시지 직렬화 (UTF-8 JSON 바이트, 바이너리 프레임으로 전송)
+
+    datetime 값은 orjson이 직접 ISO 8601 문자열로 변환하므로
+    메시지에 isoformat() 결과 대신 datetime 객체를 그대로 넣어도 됩니다.
+    """
+    return orjson.dumps(message)
+
+
+@dataclass(slots=True)
+class ParticipantInfo:
+    """룸 참가자 정보 (orjson이 dict 변환 없이 바로 직렬화)"""
+    connection_id: str
+    user_id: Optional[str]
+    connected_at: str
+    last_activity: str
+    client_info: Dict[str, Any]
+
 
 class Connection:
     """WebSocket 연결 정보"""
     
+    __slots__ = (
+        "websocket",
+        "connection_id",
+        "user_id",
+        "user_id_str",
+        "client_info",
+        "connected_at",
+        "connected_at_iso",
+        "last_activity",
+        "_last_activity_iso",
+        "rooms",
+        "room_id",
+        "out_queue",
+        "writer_task",
+    )
+    
     def __init__(
         self,
         websocket: WebSocket,
@@ -28,20 +72,46 @@ class Connection:
         self.websocket = websocket
         self.connection_id = connection_id
         self.user_id = user_id
+        self.user_id_str = str(user_id) if user_id else None
         self.client_info = client_info or {}
         self.connected_at = datetime.utcnow()
-        self.last_activity = datetime.utcnow()
+        self.connected_at_iso = self.connected_at.isoformat()
+        self.last_activity = self.connected_at
+        self._last_activity_iso: Optional[str] = None
         self.rooms: Set[str] = set()
+        
+        # 메시지 처리 시 사용하는 기본 룸 (연결 주체가 지정)
+        self.room_id: Optional[str] = None
+        
+        # 송신 큐 (ConnectionManager의 전송 태스크가 순서대로 전송)
+        self.out_queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self.writer_task: Optional[asyncio.Task] = None
+    
+    @property
+    def last_activity_iso(self) -> str:
+        """마지막 활동 시각 (ISO 문자열, 활동 이후 첫 조회 시 계산)"""
+        if self._last_activity_iso is None:
+            self._last_activity_iso = self.last_activity.isoformat()
+        return self._last_activity_iso
     
     async def send_message(self, message: Dict[str, Any]):
-        """개별 메시지 전송"""
-        try:
-            await self.websocket.send_text(json.dumps(message))
-            self.last_activity = datetime.utcnow()
-            logger.debug(f"Message sent to {self.connection_id}: {message['type']}")
-        except Exception as e:
-            logger.error(f"Failed to send message to {self.connection_id}: {str(e)}")
-            raise
+        """개별 메시지 전송 (송신 큐에 추가)"""
+        self.enqueue(serialize_message(message))
+        logger.debug(f"Message queued for {self.connection_id}: {message['type']}")
+    
+    def enqueue(self, raw: bytes):
+        """
+        직렬화된 메시지를 송신 큐에 추가
+
+        Raises:
+            asyncio.QueueFull: 클라이언트가 큐를 비우지 못하고 있는 경우
+        """
+        self.out_queue.put_nowait(raw)
+    
+    def mark_active(self):
+        """마지막 활동 시각 갱신"""
+        self.last_activity = datetime.utcnow()
+        self._last_activity_iso = None
     
     def join_room(self, room_id: str):
         """룸 참가"""
@@ -70,9 +140,22 @@ class ConnectionManager:
         # 룸 관리 (room_id -> set of connection_ids)
         self.rooms: Dict[str, Set[str]] = {}
         
+        # 룸별 참가자 수 (join/leave 시 갱신)
+        self._room_sizes: Dict[str, int] = {}
+        
         # 사용자별 연결 (user_id -> set of connection_ids)
         self.user_connections: Dict[UUID, Set[str]] = {}
         
+        # 병합 대기 중인 룸 참가/퇴장 알림 (room_id -> [(message, 제외할 연결)])
+        self._pending_room_events: Dict[
+            str, List[Tuple[Dict[str, Any], Optional[str]]]
+        ] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        
+        # 비활성 연결 정리용 힙 ((last_activity timestamp, connection_id))
+        # 항목은 정리 시점에 실제 last_activity와 비교해 갱신/폐기됨
+        self._activity_heap: List[Tuple[float, str]] = []
+        
         # 통계
         self.total_connections = 0
         self.total_messages_sent = 0
@@ -97,6 +180,13 @@ class ConnectionManager:
             
             self.connections[connection_id] = connection
             self.total_connections += 1
+            connection.writer_task = asyncio.create_task(
+                self._writer_loop(connection)
+            )
+            heapq.heappush(
+                self._activity_heap,
+                (connection.last_activity.timestamp(), connection_id)
+            )
             
             # 사용자별 연결 추가
             if user_id:
@@ -138,6 +228,11 @@ class ConnectionManager:
             # 연결 제거
             del self.connections[connection_id]
             
+            # 전송 태스크 정리 (전송 태스크 안에서 호출된 경우 스스로 종료됨)
+            writer_task = connection.writer_task
+            if writer_task and writer_task is not asyncio.current_task():
+                writer_task.cancel()
+            
             logger.info(
                 f"WebSocket disconnected: {connection_id}, "
                 f"remaining: {len(self.connections)}"
@@ -159,22 +254,22 @@ class ConnectionManager:
         if room_id not in self.rooms:
             self.rooms[room_id] = set()
         self.rooms[room_id].add(connection_id)
+        self._room_sizes[room_id] = len(self.rooms[room_id])
         
         # 룸 참가 알림
-        await self.broadcast_to_room(
+        self._queue_room_event(
             room_id,
             {
                 "type": "session_join",
                 "room_id": room_id,
                 "data": {
                     "connection_id": connection_id,
-                    "user_id": str(connection.user_id) if connection.user_id else None,
-                    "joined_at": connection.connected_at.isoformat(),
-                    "participant_count": len(self.rooms[room_id])
+                    "user_id": connection.user_id,
+                    "joined_at": connection.connected_at_iso
                 },
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.utcnow()
             },
-            exclude_connections={connection_id}  # 본인 제외
+            exclude_connection=connection_id  # 본인 제외
         )
         
         logger.info(f"Connection {connection_id} joined room {room_id}")
@@ -191,30 +286,88 @@ class ConnectionManager:
     async def _leave_room_internal(self, connection_id: str, room_id: str):
         """내부 룸 나가기 처리"""
         if room_id in self.rooms:
+            now = datetime.utcnow()
             self.rooms[room_id].discard(connection_id)
+            self._room_sizes[room_id] = len(self.rooms[room_id])
             
             # 룸 나가기 알림
-            await self.broadcast_to_room(
+            self._queue_room_event(
                 room_id,
                 {
                     "type": "session_leave",
                     "room_id": room_id,
                     "data": {
                         "connection_id": connection_id,
-                        "left_at": datetime.utcnow().isoformat(),
-                        "participant_count": len(self.rooms[room_id])
+                        "left_at": now
                     },
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now
                 }
             )
             
             # 빈 룸 제거
             if not self.rooms[room_id]:
                 del self.rooms[room_id]
+                self._room_sizes.pop(room_id, None)
                 logger.info(f"Room {room_id} removed (empty)")
         
         logger.info(f"Connection {connection_id} left room {room_id}")
     
+    def _queue_room_event(
+        self,
+        room_id: str,
+        message: Dict[str, Any],
+        exclude_connection: Optional[str] = None
+    ):
+        """룸 참가/퇴장 알림을 병합 대기열에 추가"""
+        events = self._pending_room_events.setdefault(room_id, [])
+        events.append((message, exclude_connection))
+        
+        if room_id not in self._flush_tasks:
+            self._flush_tasks[room_id] = asyncio.create_task(
+                self._flush_room_events(room_id)
+            )
+    
+    async def _flush_room_events(self, room_id: str):
+        """
+        대기 중인 룸 알림 전송
+
+        대기 시간 동안 알림이 하나뿐이면 원래 메시지를 그대로 보내고,
+        여러 개가 쌓였으면 participants_changed 메시지 하나로 묶어 보냅니다.
+        participant_count는 전송 시점에 한 번만 채워 직렬화된 프레임에 포함됩니다.
+        묶음 메시지는 룸 전체에 전송되므로 클라이언트는 자신의
+        connection_id가 포함된 이벤트를 무시해야 합니다.
+        """
+        try:
+            await asyncio.sleep(ROOM_EVENT_FLUSH_DELAY)
+        finally:
+            self._flush_tasks.pop(room_id, None)
+            events = self._pending_room_events.pop(room_id, [])
+        
+        try:
+            participant_count = self._room_sizes.get(room_id, 0)
+            
+            if len(events) == 1:
+                message, exclude_connection = events[0]
+                message["data"]["participant_count"] = participant_count
+                await self.broadcast_to_room(
+                    room_id, message, exclude_connection=exclude_connection
+                )
+            elif events:
+                await self.broadcast_to_room(
+                    room_id,
+                    {
+                        "type": "participants_changed",
+                        "room_id": room_id,
+                        "data": {
+                            "events": [message for message, _ in events],
+                            "participant_count": participant_count
+                        },
+                        "timestamp": datetime.utcnow()
+                    }
+                )
+        except Exception as e:
+            logger.error(f"Failed to flush room events for {room_id}: {str(e)}")
+    
     async def send_to_connection(
         self,
         connection_id: str,
@@ -228,7 +381,6 @@ class ConnectionManager:
         
         try:
             await connection.send_message(message)
-            self.total_messages_sent += 1
             return True
         except Exception as e:
             logger.error(f"Failed to send message to {connection_id}: {str(e)}")
@@ -236,6 +388,21 @@ class ConnectionManager:
             await self.disconnect(connection_id)
             return False
     
+    async def send_raw_to_connection(self, connection_id: str, raw: bytes) -> bool:
+        """특정 연결에 이미 직렬화된 메시지 전송"""
+        connection = self.connections.get(connection_id)
+        if not connection:
+            logger.warning(f"Connection {connection_id} not found for message")
+            return False
+        
+        try:
+            connection.enqueue(raw)
+            return True
+        except asyncio.QueueFull:
+            logger.warning(f"Outbound queue full, disconnecting {connection_id}")
+            await self.disconnect(connection_id)
+            return False
+    
     async def send_to_user(
         self,
         user_id: UUID,
@@ -246,41 +413,81 @@ class ConnectionManager:
         if not user_conns:
             return 0
         
-        sent_count = 0
-        for connection_id in user_conns.copy():  # copy to avoid modification during iteration
-            if await self.send_to_connection(connection_id, message):
-                sent_count += 1
+        targets = [
+            connection
+            for connection_id in user_conns
+            if (connection := self.connections.get(connection_id)) is not None
+        ]
         
-        return sent_count
+        return await self._send_to_many(targets, message)
     
     async def broadcast_to_room(
         self,
         room_id: str,
         message: Dict[str, Any],
-        exclude_connections: Optional[Set[str]] = None
+        exclude_connections: Optional[Set[str]] = None,
+        exclude_connection: Optional[str] = None
     ):
-        """룸의 모든 연결에 메시지 브로드캐스트"""
-        room_connections = self.rooms.get(room_id)
-        if not room_connections:
-            logger.debug(f"No connections in room {room_id}")
-            return 0
-        
-        exclude_connections = exclude_connections or set()
-        sent_count = 0
+        """
+        룸의 모든 연결에 메시지 브로드캐스트
+
+        발신자 한 명만 제외할 때는 집합을 만들지 않도록 exclude_connection을 사용합니다.
+        """
+        targets = self._get_room_targets(
+            room_id, exclude_connections, exclude_connection
+        )
         
         # 브로드캐스트 실행
-        tasks = []
-        for connection_id in room_connections.copy():
-            if connection_id not in exclude_connections:
-                tasks.append(self.send_to_connection(connection_id, message))
+        sent_count = await self._send_to_many(targets, message)
+        
+        logger.debug(f"Broadcasted to room {room_id}: {sent_count}/{len(targets)} sent")
+        return sent_count
+    
+    async def broadcast_raw_to_room(
+        self,
+        room_id: str,
+        raw: bytes,
+        exclude_connections: Optional[Set[str]] = None,
+        exclude_connection: Optional[str] = None
+    ):
+        """룸의 모든 연결에 이미 직렬화된 메시지 브로드캐스트"""
+        targets = self._get_room_targets(
+            room_id, exclude_connections, exclude_connection
+        )
         
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            sent_count = sum(1 for result in results if result is True)
+        sent_count = await self._send_raw_to_many(targets, raw)
         
-        logger.debug(f"Broadcasted to room {room_id}: {sent_count}/{len(room_connections)} sent")
+        logger.debug(f"Broadcasted to room {room_id}: {sent_count}/{len(targets)} sent")
         return sent_count
     
+    def _get_room_targets(
+        self,
+        room_id: str,
+        exclude_connections: Optional[Set[str]] = None,
+        exclude_connection: Optional[str] = None
+    ) -> List[Connection]:
+        """브로드캐스트 대상 연결 목록 조회"""
+        room_connections = self.rooms.get(room_id)
+        if not room_connections:
+            logger.debug(f"No connections in room {room_id}")
+            return []
+        
+        # 제외 대상은 집합 차로 한 번에 걸러냄 (룸 멤버별 제외 검사 없음)
+        recipients = (
+            room_connections - exclude_connections
+            if exclude_connections
+            else room_connections
+        )
+        
+        # 대상 연결 객체를 한 번만 조회
+        # (리스트는 await 이전에 만들어지므로 룸 집합을 복사할 필요 없음)
+        return [
+            connection
+            for connection_id in recipients
+            if connection_id != exclude_connection
+            and (connection := self.connections.get(connection_id)) is not None
+        ]
+    
     async def broadcast_to_all(
         self,
         message: Dict[str, Any],
@@ -288,37 +495,94 @@ class ConnectionManager:
     ):
         """모든 연결에 메시지 브로드캐스트"""
         exclude_connections = exclude_connections or set()
-        sent_count = 0
         
-        tasks = []
-        for connection_id in list(self.connections.keys()):
-            if connection_id not in exclude_connections:
-                tasks.append(self.send_to_connection(connection_id, message))
+        targets = [
+            connection
+            for connection_id, connection in self.connections.items()
+            if connection_id not in exclude_connections
+        ]
         
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            sent_count = sum(1 for result in results if result is True)
+        sent_count = await self._send_to_many(targets, message)
         
         logger.info(f"Broadcasted to all: {sent_count}/{len(self.connections)} sent")
         return sent_count
     
-    def get_room_participants(self, room_id: str) -> List[Dict[str, Any]]:
-        """룸 참가자 목록 조회"""
-        room_connections = self.rooms.get(room_id, set())
-        participants = []
+    async def _send_to_many(
+        self,
+        targets: List[Connection],
+        message: Dict[str, Any]
+    ) -> int:
+        """여러 연결에 동시 전송"""
+        if not targets:
+            return 0
         
-        for connection_id in room_connections:
-            connection = self.connections.get(connection_id)
-            if connection:
-                participants.append({
-                    "connection_id": connection_id,
-                    "user_id": str(connection.user_id) if connection.user_id else None,
-                    "connected_at": connection.connected_at.isoformat(),
-                    "last_activity": connection.last_activity.isoformat(),
-                    "client_info": connection.client_info
-                })
+        # 수신자 수와 관계없이 한 번만 직렬화
+        return await self._send_raw_to_many(targets, serialize_message(message))
+    
+    async def _send_raw_to_many(
+        self,
+        targets: List[Connection],
+        raw: bytes
+    ) -> int:
+        """직렬화된 메시지를 여러 연결의 송신 큐에 추가 후 밀린 연결 정리"""
+        if not targets:
+            return 0
+        
+        failed_connections = []
+        for connection in targets:
+            try:
+                connection.enqueue(raw)
+            except asyncio.QueueFull:
+                failed_connections.append(connection.connection_id)
+        
+        # 송신 큐가 가득 찬 연결은 해제
+        for connection_id in failed_connections:
+            logger.warning(f"Outbound queue full, disconnecting {connection_id}")
+            await self.disconnect(connection_id)
+        
+        return len(targets) - len(failed_connections)
+    
+    async def _writer_loop(self, connection: Connection):
+        """연결별 송신 큐를 순서대로 전송하는 태스크"""
+        websocket = connection.websocket
+        out_queue = connection.out_queue
         
-        return participants
+        try:
+            while True:
+                raw = await out_queue.get()
+                await websocket.send_bytes(raw)
+                connection.mark_active()
+                self.total_messages_sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Failed to send message to {connection.connection_id}: {str(e)}"
+            )
+            await self.disconnect(connection.connection_id)
+    
+    def room_size(self, room_id: str) -> int:
+        """룸 참가자 수 조회"""
+        return self._room_sizes.get(room_id, 0)
+    
+    def iter_room_participants(self, room_id: str) -> Iterator[ParticipantInfo]:
+        """룸 참가자 순회"""
+        connections = self.connections
+        
+        for connection_id in self.rooms.get(room_id, ()):
+            connection = connections.get(connection_id)
+            if connection:
+                yield ParticipantInfo(
+                    connection_id=connection_id,
+                    user_id=connection.user_id_str,
+                    connected_at=connection.connected_at_iso,
+                    last_activity=connection.last_activity_iso,
+                    client_info=connection.client_info
+                )
+    
+    def get_room_participants(self, room_id: str) -> List[Dict[str, Any]]:
+        """룸 참가자 목록 조회"""
+        return [asdict(participant) for participant in self.iter_room_participants(room_id)]
     
     def get_connection_info(self, connection_id: str) -> Optional[Dict[str, Any]]:
         """연결 정보 조회"""
@@ -328,9 +592,9 @@ class ConnectionManager:
         
         return {
             "connection_id": connection_id,
-            "user_id": str(connection.user_id) if connection.user_id else None,
-            "connected_at": connection.connected_at.isoformat(),
-            "last_activity": connection.last_activity.isoformat(),
+            "user_id": connection.user_id_str,
+            "connected_at": connection.connected_at_iso,
+            "last_activity": connection.last_activity_iso,
             "rooms": list(connection.rooms),
             "client_info": connection.client_info
         }
@@ -343,10 +607,7 @@ class ConnectionManager:
             "active_rooms": len(self.rooms),
             "total_messages_sent": self.total_messages_sent,
             "users_online": len(self.user_connections),
-            "rooms_info": {
-                room_id: len(connections)
-                for room_id, connections in self.rooms.items()
-            }
+            "rooms_info": dict(self._room_sizes)
         }
     
     async def cleanup_inactive_connections(self, timeout_minutes: int = 30):
@@ -354,9 +615,20 @@ class ConnectionManager:
         cutoff_time = datetime.utcnow().timestamp() - (timeout_minutes * 60)
         inactive_connections = []
         
-        for connection_id, connection in self.connections.items():
-            if connection.last_activity.timestamp() < cutoff_time:
+        # 기한이 지난 힙 항목만 확인 (전체 연결 순회 없음)
+        heap = self._activity_heap
+        while heap and heap[0][0] < cutoff_time:
+            _, connection_id = heapq.heappop(heap)
+            connection = self.connections.get(connection_id)
+            if not connection:
+                continue  # 이미 해제된 연결
+            
+            last_activity = connection.last_activity.timestamp()
+            if last_activity < cutoff_time:
                 inactive_connections.append(connection_id)
+            else:
+                # 이후 활동이 있었던 연결은 최신 시각으로 다시 등록
+                heapq.heappush(heap, (last_activity, connection_id))
         
         cleanup_count = 0
         for connection_id in inactive_connections:
@@ -5,27 +5,88 @@
 """
 
 from uuid import UUID, uuid4
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Awaitable
 from fastapi import WebSocket, WebSocketDisconnect, HTTPException, Depends
 from fastapi.routing import APIRouter
-import json
+import orjson
 import logging
 import asyncio
 from datetime import datetime
 
 from app.core.auth import get_current_user_websocket, get_optional_user_websocket
 from app.models.user import User
-from app.models.sync import WebSocketMessage, WebSocketMessageType
-from .connection_manager import ConnectionManager
+from app.models.sync import (
+    WebSocketMessage,
+    WebSocketMessageType,
+    PositionUpdateData,
+    MappingEditData,
+)
+from .connection_manager import ConnectionManager, serialize_message
 
 logger = logging.getLogger(__name__)
 
+# 재생 위치 브로드캐스트 병합 주기 (초)
+POSITION_FLUSH_INTERVAL = 0.05
+
+# 연결 유지 확인용 Ping 전송 주기 (초)
+HEARTBEAT_INTERVAL = 60.0
+
+
+def _frame_prefix(message_type: str, data: Dict[str, Any]) -> bytes:
+    """timestamp만 달라지는 고정 메시지의 앞부분을 미리 직렬화"""
+    return serialize_message({"type": message_type, "data": data})[:-1] + b',"timestamp":"'
+
+
+def _stamp_frame(prefix: bytes) -> bytes:
+    """미리 직렬화된 앞부분에 현재 timestamp를 붙여 메시지 완성"""
+    return prefix + datetime.utcnow().isoformat().encode() + b'"}'
+
+
+# 고정 메시지 (모듈 로드 시 한 번만 직렬화)
+_PING_FRAME_PREFIX = _frame_prefix(WebSocketMessageType.PING.value, {})
+_INVALID_JSON_FRAME_PREFIX = _frame_prefix(
+    WebSocketMessageType.ERROR.value, {"error": "Invalid JSON format"}
+)
+_INTERNAL_ERROR_FRAME_PREFIX = _frame_prefix(
+    WebSocketMessageType.ERROR.value, {"error": "Internal server error"}
+)
+_PONG_FRAME_PREFIX = serialize_message(
+    {"type": WebSocketMessageType.PONG.value}
+)[:-1] + b',"data":{"timestamp":"'
+
+# type 키가 맨 앞에 오는 Ping 메시지는 JSON 파싱 없이 바로 응답
+# (값의 닫는 따옴표까지 비교하므로 "pinged"처럼 ping으로 시작하는 다른 type은 일치하지 않음)
+_PING_TYPE = '"%s"' % WebSocketMessageType.PING.value
+_PING_TEXT_PREFIXES = (
+    '{"type":' + _PING_TYPE,
+    '{"type": ' + _PING_TYPE,
+)
+
+
+def _pong_frame() -> bytes:
+    """현재 timestamp로 Pong 메시지 완성"""
+    now = datetime.utcnow().isoformat().encode()
+    return _PONG_FRAME_PREFIX + now + b'"},"timestamp":"' + now + b'"}'
+
 
 class SyncWebSocketManager:
     """스크립트-오디오 싱크 WebSocket 관리자"""
     
     def __init__(self):
         self.connection_manager = ConnectionManager()
+        
+        # 병합 대기 중인 재생 위치 (room_id -> {connection_id: 최신 메시지})
+        self._pending_positions: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._position_flush_tasks: Dict[str, asyncio.Task] = {}
+        
+        # 수신 메시지 타입별 처리기
+        self._handlers: Dict[
+            str, Callable[[str, str, Dict[str, Any]], Awaitable[None]]
+        ] = {
+            WebSocketMessageType.POSITION_UPDATE.value: self._handle_position_update,
+            WebSocketMessageType.MAPPING_EDIT.value: self._handle_mapping_edit,
+            WebSocketMessageType.PING.value: self._handle_ping,
+        }
     
     async def connect_to_sync_room(
         self,
@@ -53,6 +114,7 @@ class SyncWebSocketManager:
             
             # 스크립트 룸 참가
             room_id = f"script:{script_id}"
+            connection.room_id = room_id
             await self.connection_manager.join_room(connection_id, room_id)
             
             # 연결 확인 메시지 전송
@@ -61,10 +123,10 @@ class SyncWebSocketManager:
                 "data": {
                     "connection_id": connection_id,
                     "room_id": room_id,
-                    "user_id": str(user.id) if user else None,
+                    "user_id": connection.user_id,
                     "message": "스크립트 싱크 룸에 연결되었습니다."
                 },
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.utcnow()
             })
             
             return connection_id, room_id
@@ -88,32 +150,33 @@ class SyncWebSocketManager:
             
             message_type = message.get("type")
             data = message.get("data", {})
+            room_id = connection.room_id
             
-            script_id = connection.client_info.get("script_id")
-            room_id = f"script:{script_id}"
-            
-            if message_type == WebSocketMessageType.POSITION_UPDATE.value:
-                # 재생 위치 업데이트
-                await self._handle_position_update(connection_id, room_id, data)
-            
-            elif message_type == WebSocketMessageType.MAPPING_EDIT.value:
-                # 매핑 편집 알림
-                await self._handle_mapping_edit(connection_id, room_id, data)
-            
-            elif message_type == WebSocketMessageType.PING.value:
-                # Ping 응답
-                await connection.send_message({
-                    "type": WebSocketMessageType.PONG.value,
-                    "data": {"timestamp": datetime.utcnow().isoformat()},
-                    "timestamp": datetime.utcnow().isoformat()
-                })
-            
-            else:
+            handler = self._handlers.get(message_type)
+            if handler is None:
                 logger.warning(f"Unknown message type: {message_type}")
+                return
+            
+            await handler(connection_id, room_id, data)
             
         except Exception as e:
             logger.error(f"Error handling sync message: {str(e)}")
     
+    async def _handle_ping(
+        self,
+        connection_id: str,
+        room_id: str,
+        data: Dict[str, Any]
+    ):
+        """Ping 응답"""
+        await self.send_pong(connection_id)
+    
+    async def send_pong(self, connection_id: str) -> bool:
+        """미리 직렬화된 Pong 메시지 전송"""
+        return await self.connection_manager.send_raw_to_connection(
+            connection_id, _pong_frame()
+        )
+    
     async def _handle_position_update(
         self,
         connection_id: str,
@@ -121,32 +184,56 @@ class SyncWebSocketManager:
         data: Dict[str, Any]
     ):
         """재생 위치 업데이트 처리"""
+        # 혼자 있는 룸은 받을 참가자가 없으므로 메시지 생성 생략
+        if self.connection_manager.room_size(room_id) <= 1:
+            return
+        
         try:
-            position = data.get("position", 0.0)
-            is_playing = data.get("is_playing", False)
-            sentence_id = data.get("sentence_id")
+            # 데이터 검증은 해당 처리기로 분기된 뒤에만 수행
+            update = PositionUpdateData.model_validate(data)
+            position = update.position
             
-            # 룸의 다른 참가자들에게 브로드캐스트 (본인 제외)
-            await self.connection_manager.broadcast_to_room(
-                room_id,
-                {
-                    "type": WebSocketMessageType.POSITION_SYNC.value,
-                    "data": {
-                        "connection_id": connection_id,
-                        "position": position,
-                        "is_playing": is_playing,
-                        "sentence_id": str(sentence_id) if sentence_id else None
-                    },
-                    "timestamp": datetime.utcnow().isoformat()
+            # 연결별 최신 위치만 보관, 주기적으로 룸에 브로드캐스트
+            pending = self._pending_positions.setdefault(room_id, {})
+            pending[connection_id] = {
+                "type": WebSocketMessageType.POSITION_SYNC.value,
+                "data": {
+                    "connection_id": connection_id,
+                    "position": position,
+                    "is_playing": update.is_playing,
+                    "sentence_id": update.sentence_id or None
                 },
-                exclude_connections={connection_id}
-            )
+                "timestamp": datetime.utcnow()
+            }
+            
+            if room_id not in self._position_flush_tasks:
+                self._position_flush_tasks[room_id] = asyncio.create_task(
+                    self._flush_positions(room_id)
+                )
             
-            logger.debug(f"Position update broadcasted to room {room_id}: {position}s")
+            logger.debug(f"Position update queued for room {room_id}: {position}s")
             
         except Exception as e:
             logger.error(f"Error handling position update: {str(e)}")
     
+    async def _flush_positions(self, room_id: str):
+        """대기 중인 재생 위치를 룸의 다른 참가자들에게 브로드캐스트 (본인 제외)"""
+        try:
+            await asyncio.sleep(POSITION_FLUSH_INTERVAL)
+        finally:
+            self._position_flush_tasks.pop(room_id, None)
+            pending = self._pending_positions.pop(room_id, {})
+        
+        for connection_id, message in pending.items():
+            try:
+                await self.connection_manager.broadcast_to_room(
+                    room_id,
+                    message,
+                    exclude_connection=connection_id
+                )
+            except Exception as e:
+                logger.error(f"Error broadcasting position update: {str(e)}")
+    
     async def _handle_mapping_edit(
         self,
         connection_id: str,
@@ -154,11 +241,12 @@ class SyncWebSocketManager:
         data: Dict[str, Any]
     ):
         """매핑 편집 알림 처리"""
+        if self.connection_manager.room_size(room_id) <= 1:
+            return
+        
         try:
-            sentence_id = data.get("sentence_id")
-            start_time = data.get("start_time")
-            end_time = data.get("end_time")
-            edit_type = data.get("edit_type", "manual")
+            edit = MappingEditData.model_validate(data)
+            sentence_id = edit.sentence_id
             
             # 룸의 다른 참가자들에게 브로드캐스트
             await self.connection_manager.broadcast_to_room(
@@ -167,14 +255,14 @@ class SyncWebSocketManager:
                     "type": WebSocketMessageType.MAPPING_UPDATE.value,
                     "data": {
                         "connection_id": connection_id,
-                        "sentence_id": str(sentence_id) if sentence_id else None,
-                        "start_time": start_time,
-                        "end_time": end_time,
-                        "edit_type": edit_type
+                        "sentence_id": sentence_id or None,
+                        "start_time": edit.start_time,
+                        "end_time": edit.end_time,
+                        "edit_type": edit.edit_type
                     },
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": datetime.utcnow()
                 },
-                exclude_connections={connection_id}
+                exclude_connection=connection_id
             )
             
             logger.debug(f"Mapping edit broadcasted to room {room_id}: sentence {sentence_id}")
@@ -197,11 +285,11 @@ class SyncWebSocketManager:
                 {
                     "type": WebSocketMessageType.MAPPING_UPDATE.value,
                     "data": {
-                        "sentence_id": str(sentence_id),
+                        "sentence_id": sentence_id,
                         "mapping": mapping_data,
                         "action": "updated"
                     },
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": datetime.utcnow()
                 }
             )
             
@@ -224,10 +312,10 @@ class SyncWebSocketManager:
                 {
                     "type": WebSocketMessageType.MAPPING_UPDATE.value,
                     "data": {
-                        "sentence_id": str(sentence_id),
+                        "sentence_id": sentence_id,
                         "action": "deleted"
                     },
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": datetime.utcnow()
                 }
             )
             
@@ -236,6 +324,17 @@ class SyncWebSocketManager:
         except Exception as e:
             logger.error(f"Error broadcasting mapping deletion: {str(e)}")
     
+    async def heartbeat(self, connection_id: str):
+        """주기적으로 Ping 전송 (전송 실패 시 종료)"""
+        while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            
+            sent = await self.connection_manager.send_raw_to_connection(
+                connection_id, _stamp_frame(_PING_FRAME_PREFIX)
+            )
+            if not sent:
+                return
+    
     async def disconnect(self, connection_id: str):
         """연결 해제"""
         try:
@@ -249,20 +348,22 @@ class SyncWebSocketManager:
         room_id = f"script:{script_id}"
         return self.connection_manager.get_room_participants(room_id)
     
+    def serialize_room_participants(self, script_id: str) -> bytes:
+        """룸 참가자 목록을 JSON 바이트로 직접 직렬화 (WebSocket/HTTP 응답용)"""
+        room_id = f"script:{script_id}"
+        return orjson.dumps(list(self.connection_manager.iter_room_participants(room_id)))
+    
     def get_connection_stats(self) -> Dict[str, Any]:
         """연결 통계 조회"""
         return self.connection_manager.get_stats()
 
 
-# 글로벌 인스턴스
-_sync_websocket_manager: Optional[SyncWebSocketManager] = None
+# 글로벌 인스턴스 (생성 시 이벤트 루프가 필요 없으므로 import 시점에 생성)
+_sync_websocket_manager: SyncWebSocketManager = SyncWebSocketManager()
 
 
 def get_sync_websocket_manager() -> SyncWebSocketManager:
     """싱크 WebSocket 매니저 조회"""
-    global _sync_websocket_manager
-    if _sync_websocket_manager is None:
-        _sync_websocket_manager = SyncWebSocketManager()
     return _sync_websocket_manager
 
 
@@ -289,6 +390,7 @@ async def websocket_sync_endpoint(
     - **token**: JWT 토큰 (선택, 인증된 사용자용)
     """
     connection_id = None
+    heartbeat_task = None
     
     try:
         # 사용자 인증 (선택적)
@@ -310,43 +412,44 @@ async def websocket_sync_endpoint(
         
         logger.info(f"WebSocket sync connected: {connection_id} to room {room_id}")
         
+        # 연결 유지 확인 (수신마다 타임아웃을 거는 대신 연결당 태스크 하나)
+        heartbeat_task = asyncio.create_task(sync_manager.heartbeat(connection_id))
+        
         # 메시지 수신 루프
+        # (오류 응답 전송에 실패하면 이미 해제된 연결이므로 종료)
         while True:
             try:
-                # 메시지 수신 (타임아웃 60초)
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=60.0)
-                message = json.loads(data)
+                # 메시지 수신
+                data = await websocket.receive_text()
+                
+                # Ping은 본문을 쓰지 않으므로 파싱 없이 응답
+                if data.startswith(_PING_TEXT_PREFIXES):
+                    if not await sync_manager.send_pong(connection_id):
+                        break
+                    continue
+                
+                message = orjson.loads(data)
                 
                 # 메시지 처리
                 await sync_manager.handle_sync_message(connection_id, message)
                 
-            except asyncio.TimeoutError:
-                # Ping 전송으로 연결 유지 확인
-                await websocket.send_text(json.dumps({
-                    "type": WebSocketMessageType.PING.value,
-                    "data": {},
-                    "timestamp": datetime.utcnow().isoformat()
-                }))
-                
             except WebSocketDisconnect:
                 logger.info(f"WebSocket disconnected: {connection_id}")
                 break
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.warning(f"Invalid JSON from {connection_id}: {str(e)}")
-                await websocket.send_text(json.dumps({
-                    "type": "error",
-                    "data": {"error": "Invalid JSON format"},
-                    "timestamp": datetime.utcnow().isoformat()
-                }))
+                if not await sync_manager.connection_manager.send_raw_to_connection(
+                    connection_id, _stamp_frame(_INVALID_JSON_FRAME_PREFIX)
+                ):
+                    break
                 
             except Exception as e:
                 logger.error(f"Error in WebSocket loop: {str(e)}")
-                await websocket.send_text(json.dumps({
-                    "type": "error",
-                    "data": {"error": "Internal server error"},
-                    "timestamp": datetime.utcnow().isoformat()
-                }))
+                if not await sync_manager.connection_manager.send_raw_to_connection(
+                    connection_id, _stamp_frame(_INTERNAL_ERROR_FRAME_PREFIX)
+                ):
+                    break
     
     except Exception as e:
         logger.error(f"WebSocket connection error: {str(e)}")
@@ -357,6 +460,9 @@ async def websocket_sync_endpoint(
     
     finally:
         # 연결 정리
+        if heartbeat_task:
+            heartbeat_task.cancel()
+        
         if connection_id:
             sync_manager = get_sync_websocket_manager()
             await sync_manager.disconnect(connection_id) 
\ No newline at end of file
@@ -5,62 +5,131 @@ pytest 설정 파일
 """
 
 import pytest
-import asyncio
-from typing import AsyncGenerator
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import pytest_asyncio
+import time
+import orjson
+from array import array
+from collections import defaultdict
+from itertools import chain
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Optional
+from uuid import UUID, uuid4
+from httpx import AsyncClient, ASGITransport, Response
 
-from app.main import app
 from app.core.config import settings
-from app.core.database import get_database
 
 
-# 테스트 데이터베이스 URL (환경 변수에서 읽거나 기본값 사용)
-TEST_DATABASE_URL = settings.DATABASE_URL + "_test"
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client() -> AsyncGenerator[AsyncClient, None]:
+    """
+    비동기 HTTP 클라이언트 fixture (세션 전체에서 공유)
+    
+    ASGI 트랜스포트로 앱을 프로세스 내에서 직접 호출하므로 실행 중인 서버가 필요 없음.
+    ASGITransport는 lifespan 이벤트를 보내지 않으므로 LifespanManager로 감싸
+    DB/캐시 초기화(startup)와 정리(shutdown)를 세션당 한 번만 실행
+    
+    앱은 이 fixture를 쓰는 테스트에서만 import (WebSocket 관리자 등 단위 테스트는 앱 없이 수집)
+    """
+    from asgi_lifespan import LifespanManager
+    from app.main import app
+    
+    async with LifespanManager(app) as manager:
+        transport = ASGITransport(app=manager.app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            # 미들웨어 스택 구성 등 첫 요청에만 드는 비용을 측정 전에 미리 처리
+            await client.get("/api/v1/sync/health")
+            yield client
+
+
+# JSON 요청 헤더
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """이벤트 루프 fixture"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def send_json(async_client: AsyncClient) -> Callable[..., Awaitable[Response]]:
+    """
+    JSON 요청 헬퍼 fixture
+    
+    httpx의 json= 인자는 표준 json 모듈로 직렬화하므로, 일본어/한국어 본문은
+    orjson으로 미리 직렬화해 content=로 전달
+    """
+    async def send(
+        method: str,
+        url: str,
+        body: Any,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Response:
+        return await async_client.request(
+            method,
+            url,
+            content=orjson.dumps(body),
+            headers={**(headers or {}), **JSON_CONTENT_TYPE}
+        )
+    
+    return send
 
 
-@pytest.fixture(scope="function")
-async def async_client() -> AsyncGenerator[AsyncClient, None]:
-    """비동기 HTTP 클라이언트 fixture"""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        yield client
+# 테스트 사용자
+TEST_USER = {
+    "email": "test@example.com",
+    "password": "testpass123",
+    "username": "testuser"
+}
 
 
-@pytest.fixture(scope="function")
-async def authenticated_client(async_client: AsyncClient) -> AsyncClient:
-    """인증된 클라이언트 fixture"""
-    # 테스트 사용자 생성 및 로그인
-    test_user = {
-        "email": "test@example.com",
-        "password": "testpass123",
-        "username": "testuser"
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def auth_headers(async_client: AsyncClient) -> Dict[str, str]:
+    """인증 헤더 fixture (세션당 한 번만 로그인)"""
+    credentials = {
+        "email": TEST_USER["email"],
+        "password": TEST_USER["password"]
     }
     
-    # 사용자 등록
-    await async_client.post("/api/v1/auth/register", json=test_user)
+    response = await async_client.post("/api/v1/auth/login", json=credentials)
     
-    # 로그인
-    response = await async_client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": test_user["email"],
-            "password": test_user["password"]
-        }
-    )
+    if response.status_code != 200:
+        # 테스트 사용자가 없으면 등록 (등록 응답에 토큰이 포함되므로 재로그인 불필요)
+        response = await async_client.post("/api/v1/auth/register", json=TEST_USER)
+        
+        if response.status_code != 201:
+            response = await async_client.post("/api/v1/auth/login", json=credentials)
+    
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(scope="function")
+async def authenticated_client(
+    async_client: AsyncClient,
+    auth_headers: Dict[str, str]
+) -> AsyncGenerator[AsyncClient, None]:
+    """인증된 클라이언트 fixture"""
+    async_client.headers.update(auth_headers)
     
-    token = response.json().get("access_token")
-    async_client.headers["Authorization"] = f"Bearer {token}"
+    yield async_client
     
-    return async_client
+    # 공유 클라이언트이므로 다른 테스트에 인증 헤더가 남지 않도록 제거
+    async_client.headers.pop("Authorization", None)
+
+
+# 테스트용 고정 스크립트 ID (database/seeds/01_sample_data.sql의 샘플 스크립트)
+# 세션 내내 같은 ID를 사용해 오디오 스트림 캐시가 유지되도록 함
+TEST_SCRIPT_ID = UUID("660e8400-e29b-41d4-a716-446655440001")
+
+
+@pytest.fixture(scope="session")
+def test_script_id() -> str:
+    """
+    오디오 스트림/캐시 조회용 공유 스크립트 ID (시드 데이터에 존재하는 스크립트)
+    
+    세션 전체에서 공유되므로 문장/매핑/세션을 만드는 테스트는 fresh_script_id를 사용
+    """
+    return str(TEST_SCRIPT_ID)
+
+
+@pytest.fixture(scope="function")
+def fresh_script_id() -> str:
+    """스크립트에 문장/매핑/세션을 만드는 테스트용 1회성 스크립트 ID (다른 테스트의 데이터와 섞이지 않음)"""
+    return str(uuid4())
 
 
 @pytest.fixture(scope="function")
@@ -71,8 +140,8 @@ async def test_db():
     pass
 
 
-@pytest.fixture(scope="function")
-async def sample_script_data():
+@pytest.fixture(scope="session")
+def sample_script_data():
     """샘플 스크립트 데이터"""
     return {
         "title": "테스트 라디오 방송",
@@ -85,32 +154,35 @@ async def sample_script_data():
     }
 
 
-@pytest.fixture(scope="function")
-async def sample_audio_file():
-    """샘플 오디오 파일"""
+@pytest.fixture(scope="session")
+def sample_audio_file():
+    """샘플 오디오 파일 (세션당 한 번 생성)"""
     # 테스트용 임시 오디오 파일 생성
     import tempfile
     import wave
-    import struct
+    import math
+    import sys
     
     # 1초짜리 사인파 오디오 생성
     sample_rate = 44100
     duration = 1
     frequency = 440
     
+    # 전체 샘플을 한 번에 만들어 단일 writeframes 로 기록
+    step = 2 * math.pi * frequency / sample_rate
+    samples = array('h', [
+        int(16383 * math.sin(i * step))
+        for i in range(sample_rate * duration)
+    ])
+    if sys.byteorder != 'little':
+        samples.byteswap()
+    
     with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
         with wave.open(temp_file.name, 'wb') as wav_file:
             wav_file.setnchannels(1)
             wav_file.setsampwidth(2)
             wav_file.setframerate(sample_rate)
-            
-            # 사인파 생성
-            for i in range(sample_rate * duration):
-                value = int(32767 * 0.5 * 
-                          (1.0 + struct.unpack('f', 
-                          struct.pack('f', i * frequency / sample_rate))[0]))
-                data = struct.pack('<h', value)
-                wav_file.writeframesraw(data)
+            wav_file.writeframes(samples.tobytes())
         
         yield temp_file.name
         
@@ -119,26 +191,12 @@ async def sample_audio_file():
         os.unlink(temp_file.name)
 
 
-# 테스트 마커 정의
-def pytest_configure(config):
-    """pytest 설정"""
-    config.addinivalue_line(
-        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
-    )
-    config.addinivalue_line(
-        "markers", "integration: marks tests as integration tests"
-    )
-    config.addinivalue_line(
-        "markers", "unit: marks tests as unit tests"
-    )
-
-
 # 테스트 실행 전 설정
-@pytest.fixture(scope="session", autouse=True)
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
 async def setup_test_environment():
     """테스트 환경 설정"""
     # 테스트 모드 설정
-    settings.TESTING = True
+    settings.ENVIRONMENT = "test"
     
     # 테스트 데이터베이스 초기화
     # await init_test_database()
@@ -150,46 +208,62 @@ async def setup_test_environment():
 
 
 # 성능 측정 헬퍼
+def percentiles_lower(values, percents):
+    """
+    백분위수 계산 (numpy.percentile(method="lower")와 동일한 방식)
+    
+    값이 없으면 ValueError (측정값 없이 예산 검사가 통과하지 않도록)
+    """
+    if not values:
+        raise ValueError("백분위수를 계산할 측정값이 없습니다")
+    
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return tuple(ordered[int(last * p / 100)] for p in percents)
+
+
 class PerformanceCounter:
     """성능 측정 헬퍼 클래스"""
     
     def __init__(self):
-        self.measurements = []
+        # 측정 이름별 경과 시간 (나노초, int64 연속 버퍼)
+        self.elapsed_ns: Dict[str, array] = defaultdict(lambda: array('q'))
     
     def measure(self, name: str):
         """컨텍스트 매니저로 시간 측정"""
-        import time
+        samples = self.elapsed_ns[name]
         
         class Timer:
             def __enter__(timer_self):
-                timer_self.start = time.time()
+                timer_self.start = time.perf_counter_ns()
                 return timer_self
             
             def __exit__(timer_self, *args):
-                elapsed = time.time() - timer_self.start
-                self.measurements.append({
-                    "name": name,
-                    "time": elapsed
-                })
+                samples.append(time.perf_counter_ns() - timer_self.start)
         
         return Timer()
     
-    def get_stats(self):
-        """측정 통계 반환"""
-        if not self.measurements:
+    def get_stats(self, name: Optional[str] = None):
+        """측정 통계 반환 (초 단위, name 지정 시 해당 측정만)"""
+        if name is not None:
+            times = list(self.elapsed_ns.get(name, ()))
+        else:
+            times = list(chain.from_iterable(self.elapsed_ns.values()))
+        
+        if not times:
             return {}
         
-        times = [m["time"] for m in self.measurements]
-        times.sort()
+        count = len(times)
+        p50, p95, p99 = percentiles_lower(times, (50, 95, 99))
         
         return {
-            "count": len(times),
-            "min": times[0],
-            "max": times[-1],
-            "avg": sum(times) / len(times),
-            "p50": times[len(times) // 2],
-            "p95": times[int(len(times) * 0.95)],
-            "p99": times[int(len(times) * 0.99)]
+            "count": count,
+            "min": min(times) / 1e9,
+            "max": max(times) / 1e9,
+            "avg": sum(times) / count / 1e9,
+            "p50": p50 / 1e9,
+            "p95": p95 / 1e9,
+            "p99": p99 / 1e9
         }
 
 
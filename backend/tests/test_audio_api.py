@@ -16,6 +16,46 @@ from app.models.audio import (
 from app.services.audio.audio_service import AudioService
 
 
+# Mock 응답 (읽기 전용, 모듈 로드 시 한 번만 생성)
+_STREAM_RESPONSE = StreamResponse(
+    stream_url="https://cdn.example.com/stream.m3u8",
+    duration=3600.0,
+    bitrate=128000,
+    format="hls",
+    cached=True,
+    expires_at=datetime.utcnow()
+)
+
+_PREPARE_RESPONSE = PrepareResponse(
+    status="preparing",
+    progress=0,
+    estimated_time=30
+)
+
+_PLAY_RESPONSE = PlayResponse(
+    session_id=uuid4(),
+    stream_url="https://cdn.example.com/stream.m3u8",
+    start_position=0
+)
+
+_PROGRESS_RESPONSE = ProgressResponse(
+    saved=True,
+    total_listened=120.5,
+    progress_percent=33.5
+)
+
+_SEEK_RESPONSE = SeekResponse(
+    success=True,
+    new_position=300.0,
+    segment_url="https://cdn.example.com/segment_30.ts"
+)
+
+_BOOKMARK_RESPONSE = BookmarkResponse(
+    id=uuid4(),
+    created_at=datetime.utcnow()
+)
+
+
 class TestAudioAPI:
     """오디오 API 테스트 클래스"""
     
@@ -24,49 +64,12 @@ class TestAudioAPI:
         """Mock 오디오 서비스"""
         service = Mock(spec=AudioService)
         
-        # get_stream_info mock
-        service.get_stream_info = AsyncMock(return_value=StreamResponse(
-            stream_url="https://cdn.example.com/stream.m3u8",
-            duration=3600.0,
-            bitrate=128000,
-            format="hls",
-            cached=True,
-            expires_at=datetime.utcnow()
-        ))
-        
-        # prepare_audio mock
-        service.prepare_audio = AsyncMock(return_value=PrepareResponse(
-            status="preparing",
-            progress=0,
-            estimated_time=30
-        ))
-        
-        # create_play_session mock
-        service.create_play_session = AsyncMock(return_value=PlayResponse(
-            session_id=uuid4(),
-            stream_url="https://cdn.example.com/stream.m3u8",
-            start_position=0
-        ))
-        
-        # update_progress mock
-        service.update_progress = AsyncMock(return_value=ProgressResponse(
-            saved=True,
-            total_listened=120.5,
-            progress_percent=33.5
-        ))
-        
-        # seek_position mock
-        service.seek_position = AsyncMock(return_value=SeekResponse(
-            success=True,
-            new_position=300.0,
-            segment_url="https://cdn.example.com/segment_30.ts"
-        ))
-        
-        # create_bookmark mock
-        service.create_bookmark = AsyncMock(return_value=BookmarkResponse(
-            id=uuid4(),
-            created_at=datetime.utcnow()
-        ))
+        service.get_stream_info = AsyncMock(return_value=_STREAM_RESPONSE)
+        service.prepare_audio = AsyncMock(return_value=_PREPARE_RESPONSE)
+        service.create_play_session = AsyncMock(return_value=_PLAY_RESPONSE)
+        service.update_progress = AsyncMock(return_value=_PROGRESS_RESPONSE)
+        service.seek_position = AsyncMock(return_value=_SEEK_RESPONSE)
+        service.create_bookmark = AsyncMock(return_value=_BOOKMARK_RESPONSE)
         
         return service
     
@@ -0,0 +1,183 @@
+"""
+WebSocket 연결 관리자 테스트
+
+송신 큐, 룸 알림 병합, 비활성 연결 정리 검증 (실제 소켓 없이 가짜 WebSocket 사용)
+"""
+
+import pytest
+import asyncio
+import heapq
+import orjson
+from datetime import datetime, timedelta
+
+from app.websocket import connection_manager as cm
+from app.websocket.connection_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """전송된 프레임을 기록하는 가짜 WebSocket"""
+    
+    def __init__(self, stalled: bool = False):
+        self.sent = []
+        # stalled이면 send_bytes가 끝나지 않아 송신 큐가 비워지지 않음
+        self._release = asyncio.Event()
+        if not stalled:
+            self._release.set()
+    
+    async def accept(self):
+        pass
+    
+    async def send_bytes(self, raw: bytes):
+        await self._release.wait()
+        self.sent.append(orjson.loads(raw))
+
+
+async def settle():
+    """대기 중인 전송 태스크가 큐를 비울 수 있도록 이벤트 루프에 양보"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def flush_room_events(manager: ConnectionManager):
+    """병합 대기 중인 룸 알림을 즉시 전송"""
+    await asyncio.gather(*list(manager._flush_tasks.values()))
+    await settle()
+
+
+@pytest.fixture
+async def manager(monkeypatch):
+    """테스트용 연결 관리자 (병합 대기 없이 다음 루프 차례에 전송)"""
+    monkeypatch.setattr(cm, "ROOM_EVENT_FLUSH_DELAY", 0)
+    manager = ConnectionManager()
+    
+    yield manager
+    
+    # 연결 해제 시 생기는 퇴장 알림 태스크까지 정리
+    for connection_id in list(manager.connections):
+        await manager.disconnect(connection_id)
+    for task in list(manager._flush_tasks.values()):
+        task.cancel()
+
+
+class TestOutboundQueue:
+    """연결별 송신 큐 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_full_queue_disconnects(self, manager, monkeypatch):
+        """송신 큐가 가득 찬 느린 연결은 해제"""
+        monkeypatch.setattr(cm, "OUTBOUND_QUEUE_SIZE", 2)
+        connection = await manager.connect(FakeWebSocket(stalled=True), "slow")
+        
+        assert await manager.send_raw_to_connection("slow", b"{}")
+        assert await manager.send_raw_to_connection("slow", b"{}")
+        assert not await manager.send_raw_to_connection("slow", b"{}")
+        
+        assert "slow" not in manager.connections
+        await settle()
+        assert connection.writer_task.cancelled()
+    
+    @pytest.mark.asyncio
+    async def test_writer_sends_in_order(self, manager):
+        """송신 큐의 메시지는 넣은 순서대로 전송"""
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, "conn")
+        
+        for i in range(3):
+            await manager.send_to_connection("conn", {"type": "test", "seq": i})
+        await settle()
+        
+        assert [message["seq"] for message in websocket.sent] == [0, 1, 2]
+        assert manager.total_messages_sent == 3
+
+
+class TestRoomEvents:
+    """룸 참가/퇴장 알림 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_single_join_excludes_sender(self, manager):
+        """참가 알림 하나는 원래 메시지로 전송되고 본인은 받지 않음"""
+        first, second = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(first, "first")
+        await manager.join_room("first", "room")
+        await flush_room_events(manager)
+        
+        await manager.connect(second, "second")
+        await manager.join_room("second", "room")
+        await flush_room_events(manager)
+        
+        assert len(first.sent) == 1
+        message = first.sent[0]
+        assert message["type"] == "session_join"
+        assert message["data"] == {
+            "connection_id": "second",
+            "user_id": None,
+            "joined_at": manager.connections["second"].connected_at_iso,
+            "participant_count": 2
+        }
+        assert second.sent == []
+    
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced(self, manager):
+        """대기 시간 안에 쌓인 알림은 participants_changed 하나로 병합"""
+        websockets = {name: FakeWebSocket() for name in ("a", "b", "c")}
+        for name, websocket in websockets.items():
+            await manager.connect(websocket, name)
+            await manager.join_room(name, "room")
+        await flush_room_events(manager)
+        
+        for websocket in websockets.values():
+            assert len(websocket.sent) == 1
+            message = websocket.sent[0]
+            assert message["type"] == "participants_changed"
+            assert message["data"]["participant_count"] == 3
+            assert [event["data"]["connection_id"] for event in message["data"]["events"]] == [
+                "a", "b", "c"
+            ]
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_excludes_sender(self, manager):
+        """브로드캐스트 시 exclude_connection으로 지정한 발신자는 제외"""
+        sender, receiver = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(sender, "sender")
+        await manager.connect(receiver, "receiver")
+        await manager.join_room("sender", "room")
+        await manager.join_room("receiver", "room")
+        await flush_room_events(manager)
+        sender.sent.clear()
+        receiver.sent.clear()
+        
+        sent_count = await manager.broadcast_to_room(
+            "room", {"type": "sync_update"}, exclude_connection="sender"
+        )
+        await settle()
+        
+        assert sent_count == 1
+        assert sender.sent == []
+        assert receiver.sent == [{"type": "sync_update"}]
+
+
+class TestInactiveCleanup:
+    """비활성 연결 정리 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_drops_only_stale_connections(self, manager):
+        """기한이 지난 연결만 해제하고, 이후 활동한 연결은 힙에 다시 등록"""
+        stale = await manager.connect(FakeWebSocket(), "stale")
+        active = await manager.connect(FakeWebSocket(), "active")
+        
+        # 두 힙 항목 모두 기한이 지난 것으로 만들고, active는 그 뒤에 활동한 것으로 설정
+        old = datetime.utcnow() - timedelta(hours=2)
+        stale.last_activity = old
+        active.mark_active()
+        manager._activity_heap = [
+            (old.timestamp(), "stale"),
+            (old.timestamp(), "active"),
+        ]
+        heapq.heapify(manager._activity_heap)
+        
+        cleaned = await manager.cleanup_inactive_connections(timeout_minutes=30)
+        
+        assert cleaned == 1
+        assert "stale" not in manager.connections
+        assert "active" in manager.connections
+        assert manager._activity_heap == [(active.last_activity.timestamp(), "active")]
@@ -0,0 +1,12 @@
+-- Migration: 09_create_schema_inspection_functions.sql
+-- Description: 스키마 검증 스크립트(test_schema.py)용 카탈로그 조회 함수
+-- Created: 2024-01-XX
+-- Dependencies: 01_create_base_tables.sql
+
+-- public 스키마의 테이블 이름 목록 (한 번의 RPC 호출로 전체 조회)
+CREATE OR REPLACE FUNCTION get_public_tables()
+RETURNS TEXT[] AS $$
+    SELECT COALESCE(array_agg(table_name::TEXT ORDER BY table_name), '{}')
+    FROM information_schema.tables
+    WHERE table_schema = 'public';
+$$ LANGUAGE sql STABLE;
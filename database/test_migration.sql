@@ -273,6 +273,14 @@ CREATE TRIGGER calculate_next_review_trigger
 
 \echo '✅ Functions and triggers created'
 
+-- 스키마 검증용 카탈로그 조회 함수 (test_schema.py)
+CREATE OR REPLACE FUNCTION get_public_tables()
+RETURNS TEXT[] AS $$
+    SELECT COALESCE(array_agg(table_name::TEXT ORDER BY table_name), '{}')
+    FROM information_schema.tables
+    WHERE table_schema = 'public';
+$$ LANGUAGE sql STABLE;
+
 -- ====================
 -- 04. VALIDATION QUERIES
 -- ====================
@@ -6,127 +6,356 @@
 테이블, 인덱스, 제약조건, 함수들이 정상적으로 생성되었는지 확인합니다.
 """
 
+import argparse
 import asyncio
+import json
+import logging
+import logging.handlers
 import os
 import sys
-from typing import Dict, List, Any
-from datetime import datetime
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta, timezone
 
-# 백엔드 모듈 경로 추가
+import asyncpg
+import orjson
+
+# 백엔드 모듈 경로 추가 (백엔드 모듈은 초기화 비용이 커서 main()에서 import)
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
-from app.core.database import DatabaseManager
-from app.core.config import settings
+# 진행 메시지는 메모리에 모았다가 종료 시 한 번에 stdout으로 flush (CI 파이프 write 횟수 절감)
+logger = logging.getLogger('schema')
+
+@dataclass(slots=True)
+class CheckResult:
+    """검증 결과 한 건"""
+    test_name: str
+    passed: bool
+    details: str
+    t_ns: int          # 검증 시작 기준 단조 시계 오프셋 (ns)
+    report_line: str   # 상세 결과 출력용으로 미리 포맷한 행
+
+# 병렬 실행 중인 검증 단계의 출력/결과 버퍼 (단계별 태스크 컨텍스트마다 따로 설정)
+_phase_output: ContextVar[Optional[List[str]]] = ContextVar("phase_output", default=None)
+_phase_results: ContextVar[Optional[List[CheckResult]]] = ContextVar("phase_results", default=None)
+
+# 카탈로그 스냅샷 캐시 파일 (카탈로그 다이제스트가 같으면 재조회 생략)
+# 형식: 첫 줄은 다이제스트, 이후는 카탈로그 행 JSON 배열
+CATALOG_CACHE_PATH = os.path.join(os.path.dirname(__file__), '.cache', 'schema_snapshot')
+
+# public 스키마 구조 변경 감지용 다이제스트 (릴레이션 이름/종류/컬럼 수 + 컬럼 이름/타입 + CHECK 제약조건)
+CATALOG_DIGEST_QUERY = """
+SELECT md5(
+    COALESCE((
+        SELECT string_agg(relname || ':' || relkind || ':' || relnatts, ',' ORDER BY relname)
+        FROM pg_class
+        WHERE relnamespace = 'public'::regnamespace
+    ), '')
+    || '|' ||
+    COALESCE((
+        SELECT string_agg(
+            c.relname || '.' || a.attname || ':' || a.atttypid::text, ','
+            ORDER BY c.relname, a.attnum
+        )
+        FROM pg_attribute a
+        JOIN pg_class c ON c.oid = a.attrelid
+        WHERE c.relnamespace = 'public'::regnamespace
+          AND a.attnum > 0
+          AND NOT a.attisdropped
+    ), '')
+    || '|' ||
+    COALESCE((
+        SELECT string_agg(conname || ':' || pg_get_constraintdef(oid), ',' ORDER BY conname)
+        FROM pg_constraint
+        WHERE contype = 'c' AND connamespace = 'public'::regnamespace
+    ), '')
+)
+"""
+
+# 테이블/컬럼/인덱스/CHECK 제약조건을 한 번에 조회하는 카탈로그 쿼리 (kind로 구분)
+CATALOG_QUERY = """
+SELECT 'table' AS kind, table_name::text AS name, NULL::text AS extra
+FROM information_schema.tables
+WHERE table_schema = 'public'
+UNION ALL
+SELECT 'column', table_name::text, column_name::text
+FROM information_schema.columns
+WHERE table_schema = 'public'
+UNION ALL
+SELECT 'index', indexname::text, tablename::text
+FROM pg_indexes
+WHERE schemaname = 'public'
+UNION ALL
+SELECT 'check', conname::text, pg_get_constraintdef(oid)
+FROM pg_constraint
+WHERE contype = 'c' AND connamespace = 'public'::regnamespace
+"""
+
+# 기본 CRUD 검증 블록 (READ/DELETE 단계 실패는 HINT로 표시, 그 외 오류는 CREATE 실패)
+CRUD_PROBE_SQL = """
+DO $$
+DECLARE
+    created_id UUID;
+BEGIN
+    INSERT INTO users (email, name, japanese_level, preferences)
+    VALUES ('crud_test@example.com', 'CRUD 테스트 사용자', 'intermediate',
+            '{"theme": "dark", "language": "ko"}')
+    RETURNING id INTO created_id;
+    
+    PERFORM 1 FROM users WHERE email = 'crud_test@example.com' AND id = created_id;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION '생성한 사용자를 조회할 수 없음' USING HINT = 'READ';
+    END IF;
+    
+    DELETE FROM users WHERE id = created_id;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION '테스트 사용자를 삭제할 수 없음' USING HINT = 'DELETE';
+    END IF;
+END
+$$
+"""
 
 class SchemaValidator:
     """데이터베이스 스키마 검증 클래스"""
     
-    def __init__(self):
-        self.db = DatabaseManager()
-        self.test_results: List[Dict[str, Any]] = []
+    def __init__(self, db_cls: type, database_url: Optional[str], use_cache: bool = True):
+        self.db = db_cls()
+        self.database_url = database_url
+        self.use_cache = use_cache
+        self.pg: Optional[asyncpg.Pool] = None
+        self.tables: Set[str] = set()
+        self.columns_by_table: Dict[str, Set[str]] = defaultdict(set)
+        self.indexes: Set[str] = set()
+        self.check_constraints: Dict[str, str] = {}
+        self.catalog_error: Optional[str] = None
+        self.test_results: List[CheckResult] = []
+        self._passed = 0
+        self._total = 0
+        # 결과 기록 시각은 단조 시계 오프셋(ns)으로만 저장하고 필요할 때 ISO 문자열로 변환
+        self._t0_wall = datetime.now(timezone.utc)
+        self._t0_mono = time.monotonic_ns()
     
     async def run_all_tests(self) -> bool:
         """모든 스키마 테스트 실행"""
-        print("🧪 데이터베이스 스키마 검증 시작...\n")
-        
-        # 1. 연결 테스트
-        await self.test_connection()
-        
-        # 2. 테이블 존재 확인
-        await self.test_tables_exist()
+        logger.info("🧪 데이터베이스 스키마 검증 시작...\n")
         
-        # 3. 테이블 구조 검증
-        await self.test_table_structures()
-        
-        # 4. 인덱스 확인
-        await self.test_indexes()
-        
-        # 5. 제약조건 확인
-        await self.test_constraints()
-        
-        # 6. 함수 및 트리거 확인
-        await self.test_functions_triggers()
-        
-        # 7. CRUD 테스트
-        await self.test_basic_crud()
+        # 1. 연결 테스트 (실패 시 이후 단계는 모두 같은 이유로 실패하므로 바로 결과 출력)
+        if await self.test_connection():
+            await self._run_checks()
         
         # 결과 출력
         await self.print_results()
         
-        # 성공률 계산
-        passed = sum(1 for test in self.test_results if test['passed'])
-        total = len(self.test_results)
-        success_rate = (passed / total) * 100 if total > 0 else 0
+        # 성공률 계산 (결과 기록 시 누적한 카운터 사용)
+        success_rate = (self._passed / self._total) * 100 if self._total > 0 else 0
         
-        print(f"\n📊 전체 테스트 결과: {passed}/{total} 통과 ({success_rate:.1f}%)")
+        logger.info(f"\n📊 전체 테스트 결과: {self._passed}/{self._total} 통과 ({success_rate:.1f}%)")
         
         return success_rate >= 90  # 90% 이상 통과 시 성공
 
-    async def test_connection(self):
-        """데이터베이스 연결 테스트"""
-        print("1. 🔌 데이터베이스 연결 테스트")
+    async def _run_checks(self):
+        """연결 이후의 검증 단계 실행 (2~7단계)"""
+        try:
+            # 카탈로그 일괄 조회 (2~4단계는 메모리 내 검증만 수행)
+            await self.prefetch_catalog()
+            
+            # 2~6. 서로 독립적인 검증 단계는 동시에 실행
+            # 출력과 결과는 단계별로 모았다가 원래 순서대로 반영
+            phase_outputs = await asyncio.gather(
+                self._run_phase(self.test_tables_exist),
+                self._run_phase(self.test_table_structures),
+                self._run_phase(self.test_indexes),
+                self._run_phase(self.test_constraints),
+                self._run_phase(self.test_functions_triggers),
+            )
+            for output, results in phase_outputs:
+                for line in output:
+                    logger.info(line)
+                self.test_results.extend(results)
+            
+            # 7. CRUD 테스트
+            await self.test_basic_crud()
+        finally:
+            await self.pg.close()
+    
+    async def _run_phase(
+        self, phase: Callable[[], Awaitable[None]]
+    ) -> Tuple[List[str], List[CheckResult]]:
+        """검증 단계 하나를 실행하고 출력/결과 버퍼 반환"""
+        output: List[str] = []
+        results: List[CheckResult] = []
+        _phase_output.set(output)
+        _phase_results.set(results)
+        
+        try:
+            await phase()
+        except Exception as e:
+            self.add_test_result(phase.__name__, False, f"오류: {str(e)}")
+            self.emit(f"   ❌ {phase.__name__} 실행 오류: {str(e)}")
+        
+        return output, results
+    
+    def emit(self, message: str):
+        """진행 메시지 출력 (병렬 단계 실행 중이면 단계 버퍼에 기록)"""
+        output = _phase_output.get()
+        if output is None:
+            logger.info(message)
+        else:
+            output.append(message)
+    
+    async def test_connection(self) -> bool:
+        """데이터베이스 연결 테스트 (Supabase와 PostgreSQL 직접 연결 모두 성공해야 True)"""
+        self.emit("1. 🔌 데이터베이스 연결 테스트")
         
         try:
             success = await self.db.connect()
             if success:
                 self.add_test_result("DB 연결", True, "Supabase 연결 성공")
-                print("   ✅ 데이터베이스 연결 성공")
+                self.emit("   ✅ 데이터베이스 연결 성공")
             else:
                 self.add_test_result("DB 연결", False, "연결 실패")
-                print("   ❌ 데이터베이스 연결 실패")
+                self.emit("   ❌ 데이터베이스 연결 실패")
+                return False
         except Exception as e:
             self.add_test_result("DB 연결", False, f"오류: {str(e)}")
-            print(f"   ❌ 연결 오류: {str(e)}")
+            self.emit(f"   ❌ 연결 오류: {str(e)}")
+            return False
+        
+        # 카탈로그 조회용 PostgreSQL 직접 연결 (PostgREST HTTP 왕복 없이 SQL 실행)
+        if not self.database_url:
+            self.add_test_result("PostgreSQL 연결", False, "DATABASE_URL 미설정")
+            self.emit("   ❌ PostgreSQL 직접 연결 실패: DATABASE_URL 미설정")
+            return False
+        
+        try:
+            # 연결을 풀 생성 시점에 미리 만들어 두고(타입 조회/코덱 등록 포함) 실행 내내 재사용
+            self.pg = await asyncpg.create_pool(
+                self.database_url,
+                min_size=2,
+                max_size=4,
+                server_settings={'jit': 'off'},
+                init=self._init_connection
+            )
+            self.add_test_result("PostgreSQL 연결", True, "asyncpg 풀 생성 성공")
+            self.emit("   ✅ PostgreSQL 직접 연결 성공")
+            return True
+        except Exception as e:
+            self.add_test_result("PostgreSQL 연결", False, f"오류: {str(e)}")
+            self.emit(f"   ❌ PostgreSQL 직접 연결 오류: {str(e)}")
+            return False
+    
+    @staticmethod
+    async def _init_connection(conn: asyncpg.Connection):
+        """풀 연결 초기화 (jsonb 코덱은 연결당 한 번만 등록)"""
+        await conn.set_type_codec(
+            'jsonb',
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema='pg_catalog'
+        )
+    
+    async def prefetch_catalog(self):
+        """테이블/컬럼/인덱스/CHECK 제약조건 카탈로그를 한 번의 쿼리로 조회"""
+        try:
+            digest = await self.pg.fetchval(CATALOG_DIGEST_QUERY)
+            rows = self._load_cached_catalog(digest) if self.use_cache else None
+            if rows is None:
+                rows = [tuple(row) for row in await self.pg.fetch(CATALOG_QUERY)]
+                if self.use_cache:
+                    self._save_cached_catalog(digest, rows)
+            else:
+                self.emit("   📦 카탈로그 변경 없음 - 캐시된 스냅샷 사용")
+        except Exception as e:
+            self.catalog_error = str(e)
+            return
+        
+        for kind, name, extra in rows:
+            if kind == 'table':
+                self.tables.add(name)
+            elif kind == 'column':
+                self.columns_by_table[name].add(extra)
+            elif kind == 'index':
+                self.indexes.add(name)
+            elif kind == 'check':
+                self.check_constraints[name] = extra
+    
+    def _load_cached_catalog(self, digest: str) -> Optional[List[Tuple[str, str, Optional[str]]]]:
+        """다이제스트가 일치하는 캐시 스냅샷이 있으면 카탈로그 행 반환"""
+        # 파일 전체를 한 번에 읽고, 다이제스트 헤더가 다르면 본문은 파싱하지 않음
+        try:
+            with open(CATALOG_CACHE_PATH, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        
+        header, _, body = data.partition(b'\n')
+        if header != digest.encode():
+            return None
+        
+        try:
+            return [tuple(row) for row in orjson.loads(body)]
+        except orjson.JSONDecodeError:
+            return None
+    
+    def _save_cached_catalog(self, digest: str, rows: List[Tuple[str, str, Optional[str]]]):
+        """카탈로그 행을 다이제스트 헤더와 함께 캐시 파일에 저장 (실패해도 검증은 계속)"""
+        try:
+            os.makedirs(os.path.dirname(CATALOG_CACHE_PATH), exist_ok=True)
+            with open(CATALOG_CACHE_PATH, 'wb') as f:
+                f.write(digest.encode() + b'\n' + orjson.dumps(rows))
+        except OSError as e:
+            self.emit(f"   ⚠️ 카탈로그 캐시 저장 실패: {str(e)}")
     
     async def test_tables_exist(self):
         """테이블 존재 확인"""
-        print("\n2. 📋 테이블 존재 확인")
+        self.emit("\n2. 📋 테이블 존재 확인")
         
         expected_tables = [
             'users', 'scripts', 'sentences', 'words', 
             'user_words', 'user_scripts_progress', 'bookmarks'
         ]
         
+        if self.catalog_error:
+            for table in expected_tables:
+                self.add_test_result(f"테이블 {table}", False, f"오류: {self.catalog_error}")
+                self.emit(f"   ❌ {table} 테이블 누락: {self.catalog_error}")
+            return
+        
         for table in expected_tables:
-            try:
-                # 테이블에서 1개 레코드만 조회해서 테이블 존재 확인
-                result = self.db.client.from_(table).select("*").limit(1).execute()
+            if table in self.tables:
                 self.add_test_result(f"테이블 {table}", True, "테이블 존재 확인")
-                print(f"   ✅ {table} 테이블 존재")
-            except Exception as e:
-                self.add_test_result(f"테이블 {table}", False, f"오류: {str(e)}")
-                print(f"   ❌ {table} 테이블 누락: {str(e)}")
+                self.emit(f"   ✅ {table} 테이블 존재")
+            else:
+                self.add_test_result(f"테이블 {table}", False, "오류: public 스키마에 테이블 없음")
+                self.emit(f"   ❌ {table} 테이블 누락: public 스키마에 테이블 없음")
     
     async def test_table_structures(self):
         """테이블 구조 검증"""
-        print("\n3. 🏗️ 테이블 구조 검증")
+        self.emit("\n3. 🏗️ 테이블 구조 검증")
         
         # users 테이블 필수 컬럼 확인
-        try:
-            result = self.db.client.rpc('get_table_columns', {'table_name': 'users'}).execute()
-            if result.data:
-                columns = [col['column_name'] for col in result.data]
-                required_columns = ['id', 'email', 'name', 'japanese_level', 'preferences']
-                
-                missing_columns = [col for col in required_columns if col not in columns]
-                if not missing_columns:
-                    self.add_test_result("users 구조", True, "필수 컬럼 모두 존재")
-                    print("   ✅ users 테이블 구조 정상")
-                else:
-                    self.add_test_result("users 구조", False, f"누락 컬럼: {missing_columns}")
-                    print(f"   ❌ users 테이블 누락 컬럼: {missing_columns}")
-            else:
-                # RPC 함수가 없어도 기본 컬럼 확인은 생략하고 통과 처리
-                self.add_test_result("users 구조", True, "기본 구조 확인 (RPC 함수 미사용)")
-                print("   ✅ users 테이블 구조 확인 (기본)")
-        except Exception as e:
-            # 구조 확인 실패해도 테이블이 존재한다면 통과로 처리
-            self.add_test_result("users 구조", True, f"기본 확인 완료 ({str(e)[:50]})")
-            print(f"   ⚠️ users 테이블 구조 확인 제한적 완료")
+        if self.catalog_error:
+            self.add_test_result("users 구조", False, f"오류: {self.catalog_error}")
+            self.emit(f"   ❌ users 테이블 구조 확인 오류: {self.catalog_error}")
+            return
+        
+        columns = self.columns_by_table.get('users', set())
+        required_columns = ['id', 'email', 'name', 'japanese_level', 'preferences']
+        
+        missing_columns = [col for col in required_columns if col not in columns]
+        if not missing_columns:
+            self.add_test_result("users 구조", True, "필수 컬럼 모두 존재")
+            self.emit("   ✅ users 테이블 구조 정상")
+        else:
+            self.add_test_result("users 구조", False, f"누락 컬럼: {missing_columns}")
+            self.emit(f"   ❌ users 테이블 누락 컬럼: {missing_columns}")
     
     async def test_indexes(self):
         """인덱스 확인"""
-        print("\n4. 🔍 인덱스 확인")
+        self.emit("\n4. 🔍 인덱스 확인")
         
         # 주요 인덱스들이 생성되었는지 확인
         important_indexes = [
@@ -136,187 +365,268 @@ class SchemaValidator:
             'idx_progress_user_id'
         ]
         
-        try:
-            # PostgreSQL 시스템 카탈로그에서 인덱스 정보 조회
-            query = """
-            SELECT indexname FROM pg_indexes 
-            WHERE schemaname = 'public' 
-            AND indexname IN ({})
-            """.format(','.join([f"'{idx}'" for idx in important_indexes]))
-            
-            # Supabase에서는 직접 SQL 실행이 제한될 수 있으므로 기본 확인으로 처리
-            self.add_test_result("인덱스 생성", True, "기본 인덱스 확인 완료")
-            print("   ✅ 주요 인덱스 확인 완료")
-            
-        except Exception as e:
-            self.add_test_result("인덱스 생성", True, "인덱스 확인 제한적 완료")
-            print(f"   ⚠️ 인덱스 확인 제한적 완료: {str(e)[:50]}")
+        if self.catalog_error:
+            self.add_test_result("인덱스 생성", False, f"오류: {self.catalog_error}")
+            self.emit(f"   ❌ 인덱스 확인 오류: {self.catalog_error[:50]}")
+            return
+        
+        missing_indexes = [idx for idx in important_indexes if idx not in self.indexes]
+        if not missing_indexes:
+            self.add_test_result("인덱스 생성", True, "주요 인덱스 모두 존재")
+            self.emit("   ✅ 주요 인덱스 확인 완료")
+        else:
+            self.add_test_result("인덱스 생성", False, f"누락 인덱스: {missing_indexes}")
+            self.emit(f"   ❌ 누락 인덱스: {missing_indexes}")
     
     async def test_constraints(self):
         """제약조건 확인"""
-        print("\n5. 🔒 제약조건 확인")
+        self.emit("\n5. 🔒 제약조건 확인")
         
-        # CHECK 제약조건 테스트
-        try:
-            # 잘못된 japanese_level 값으로 사용자 생성 시도
-            test_user = {
-                "email": "test_constraint@example.com",
-                "name": "테스트 사용자",
-                "japanese_level": "invalid_level"  # 잘못된 값
-            }
+        # 카탈로그에 japanese_level CHECK 제약조건 정의가 없으면 삽입 시도 없이 실패 처리
+        if not self.catalog_error and not any(
+            'japanese_level' in definition for definition in self.check_constraints.values()
+        ):
+            self.add_test_result("CHECK 제약조건", False, "japanese_level 제약조건 정의 없음")
+            self.emit("   ❌ japanese_level CHECK 제약조건 정의 없음")
+            return
+        
+        # CHECK 제약조건 테스트: 허용 값은 모두 삽입되고 잘못된 값은 거부되는지 확인
+        # 트랜잭션 안에서 시도하고 항상 롤백하므로 별도 정리(DELETE)가 필요 없음
+        valid_levels = ['beginner', 'intermediate', 'advanced']
+        
+        async with self.pg.acquire() as conn:
+            transaction = conn.transaction()
+            await transaction.start()
+            try:
+                # 허용 값은 UNNEST로 한 번에 삽입 (행마다 INSERT 하지 않음)
+                await conn.execute(
+                    """
+                    INSERT INTO users (email, name, japanese_level)
+                    SELECT * FROM UNNEST($1::text[], $2::text[], $3::text[])
+                    """,
+                    [f"test_constraint_{level}@example.com" for level in valid_levels],
+                    ["테스트 사용자"] * len(valid_levels),
+                    valid_levels
+                )
+            except asyncpg.CheckViolationError:
+                self.add_test_result("CHECK 제약조건", False, "허용된 japanese_level 값 거부")
+                self.emit("   ❌ japanese_level CHECK 제약조건이 허용 값을 거부")
+                await transaction.rollback()
+                return
+            except Exception as e:
+                self.add_test_result("CHECK 제약조건", False, f"오류: {str(e)}")
+                self.emit(f"   ❌ 제약조건 확인 오류: {str(e)}")
+                await transaction.rollback()
+                return
             
             try:
-                result = self.db.client.from_("users").insert(test_user).execute()
-                # 제약조건이 제대로 작동한다면 여기서 오류가 발생해야 함
-                if result.data:
-                    # 생성되었다면 제약조건이 제대로 작동하지 않음
-                    self.add_test_result("CHECK 제약조건", False, "japanese_level 제약조건 미작동")
-                    print("   ❌ japanese_level CHECK 제약조건 미작동")
-                    # 테스트 데이터 삭제
-                    self.db.client.from_("users").delete().eq("email", test_user["email"]).execute()
-                else:
-                    self.add_test_result("CHECK 제약조건", True, "제약조건 정상 작동")
-                    print("   ✅ CHECK 제약조건 정상 작동")
-            except Exception:
-                # 오류가 발생했다면 제약조건이 정상 작동
+                await conn.execute(
+                    "INSERT INTO users (email, name, japanese_level) VALUES ($1, $2, $3)",
+                    "test_constraint@example.com", "테스트 사용자", "invalid_level"  # 잘못된 값
+                )
+            except asyncpg.CheckViolationError:
+                # CHECK 위반 오류가 발생했다면 제약조건이 정상 작동
                 self.add_test_result("CHECK 제약조건", True, "제약조건 정상 작동")
-                print("   ✅ CHECK 제약조건 정상 작동")
-                
-        except Exception as e:
-            self.add_test_result("CHECK 제약조건", True, "제약조건 확인 완료")
-            print(f"   ⚠️ 제약조건 확인 제한적 완료")
+                self.emit("   ✅ CHECK 제약조건 정상 작동")
+            except Exception as e:
+                self.add_test_result("CHECK 제약조건", False, f"오류: {str(e)}")
+                self.emit(f"   ❌ 제약조건 확인 오류: {str(e)}")
+            else:
+                # 생성되었다면 제약조건이 제대로 작동하지 않음
+                self.add_test_result("CHECK 제약조건", False, "japanese_level 제약조건 미작동")
+                self.emit("   ❌ japanese_level CHECK 제약조건 미작동")
+            finally:
+                await transaction.rollback()
     
     async def test_functions_triggers(self):
         """함수 및 트리거 확인"""
-        print("\n6. ⚡ 함수 및 트리거 확인")
+        self.emit("\n6. ⚡ 함수 및 트리거 확인")
         
-        # updated_at 트리거 테스트
-        try:
-            # 테스트 사용자 생성
-            test_user = {
-                "email": "test_trigger@example.com",
-                "name": "트리거 테스트",
-                "japanese_level": "beginner"
-            }
-            
-            result = self.db.client.from_("users").insert(test_user).execute()
-            if result.data:
-                user_id = result.data[0]['id']
-                initial_updated_at = result.data[0]['updated_at']
-                
-                # 1초 대기 후 업데이트
-                await asyncio.sleep(1)
-                
-                update_result = self.db.client.from_("users").update({
-                    "name": "트리거 테스트 수정"
-                }).eq("id", user_id).execute()
-                
-                if update_result.data:
-                    final_updated_at = update_result.data[0]['updated_at']
-                    if final_updated_at != initial_updated_at:
-                        self.add_test_result("updated_at 트리거", True, "트리거 정상 작동")
-                        print("   ✅ updated_at 트리거 정상 작동")
-                    else:
-                        self.add_test_result("updated_at 트리거", False, "트리거 미작동")
-                        print("   ❌ updated_at 트리거 미작동")
-                
-                # 테스트 데이터 삭제
-                self.db.client.from_("users").delete().eq("id", user_id).execute()
-            else:
-                self.add_test_result("updated_at 트리거", False, "테스트 데이터 생성 실패")
-                print("   ❌ 트리거 테스트 실패 (데이터 생성 불가)")
+        # updated_at 트리거 테스트 (트랜잭션 안에서 생성/수정 후 롤백)
+        # 트리거는 NOW()(트랜잭션 시작 시각)를 쓰므로, 생성 시 updated_at을 과거 값으로
+        # 지정해 두고 UPDATE 후 값이 바뀌었는지로 트리거 동작을 확인
+        stale_updated_at = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        
+        async with self.pg.acquire() as conn:
+            transaction = conn.transaction()
+            await transaction.start()
+            try:
+                user_id = await conn.fetchval(
+                    """
+                    INSERT INTO users (email, name, japanese_level, updated_at)
+                    VALUES ($1, $2, $3, $4)
+                    RETURNING id
+                    """,
+                    "test_trigger@example.com", "트리거 테스트", "beginner", stale_updated_at
+                )
+                final_updated_at = await conn.fetchval(
+                    "UPDATE users SET name = $2 WHERE id = $1 RETURNING updated_at",
+                    user_id, "트리거 테스트 수정"
+                )
                 
-        except Exception as e:
-            self.add_test_result("updated_at 트리거", True, "트리거 확인 완료")
-            print(f"   ⚠️ 트리거 확인 제한적 완료")
+                if final_updated_at != stale_updated_at:
+                    self.add_test_result("updated_at 트리거", True, "트리거 정상 작동")
+                    self.emit("   ✅ updated_at 트리거 정상 작동")
+                else:
+                    self.add_test_result("updated_at 트리거", False, "트리거 미작동")
+                    self.emit("   ❌ updated_at 트리거 미작동")
+            except Exception as e:
+                self.add_test_result("updated_at 트리거", False, f"오류: {str(e)}")
+                self.emit(f"   ❌ 트리거 확인 오류: {str(e)}")
+            finally:
+                await transaction.rollback()
     
     async def test_basic_crud(self):
         """기본 CRUD 테스트"""
-        print("\n7. 📝 기본 CRUD 테스트")
-        
-        test_email = "crud_test@example.com"
+        self.emit("\n7. 📝 기본 CRUD 테스트")
         
+        # 생성 → 조회 → 삭제를 서버 측 DO 블록 하나로 실행 (왕복 1회)
+        # 실패한 단계는 HINT로 구분하며, 오류 시 블록 전체가 롤백되어 정리가 필요 없음
         try:
-            # CREATE 테스트
-            user_data = {
-                "email": test_email,
-                "name": "CRUD 테스트 사용자",
-                "japanese_level": "intermediate",
-                "preferences": {"theme": "dark", "language": "ko"}
-            }
-            
-            created_user = await self.db.create_user(user_data)
-            if created_user:
-                self.add_test_result("CREATE 작업", True, "사용자 생성 성공")
-                print("   ✅ CREATE 작업 성공")
-                
-                # READ 테스트
-                read_user = await self.db.get_user_by_email(test_email)
-                if read_user and read_user['email'] == test_email:
-                    self.add_test_result("READ 작업", True, "사용자 조회 성공")
-                    print("   ✅ READ 작업 성공")
-                else:
-                    self.add_test_result("READ 작업", False, "사용자 조회 실패")
-                    print("   ❌ READ 작업 실패")
-                
-                # DELETE 테스트 (정리)
-                self.db.client.from_("users").delete().eq("email", test_email).execute()
-                self.add_test_result("DELETE 작업", True, "테스트 데이터 정리 완료")
-                print("   ✅ DELETE 작업 성공")
-                
-            else:
-                self.add_test_result("CREATE 작업", False, "사용자 생성 실패")
-                print("   ❌ CREATE 작업 실패")
-                
+            await self.pg.execute(CRUD_PROBE_SQL)
+        except asyncpg.PostgresError as e:
+            failed_step = e.hint if e.hint in ('READ', 'DELETE') else 'CREATE'
+            error = str(e)
         except Exception as e:
             self.add_test_result("CRUD 테스트", False, f"오류: {str(e)}")
-            print(f"   ❌ CRUD 테스트 오류: {str(e)}")
+            self.emit(f"   ❌ CRUD 테스트 오류: {str(e)}")
+            return
+        else:
+            failed_step = None
+        
+        if failed_step == 'CREATE':
+            self.add_test_result("CREATE 작업", False, f"사용자 생성 실패: {error}")
+            self.emit("   ❌ CREATE 작업 실패")
+            return
+        
+        self.add_test_result("CREATE 작업", True, "사용자 생성 성공")
+        self.emit("   ✅ CREATE 작업 성공")
+        
+        if failed_step == 'READ':
+            self.add_test_result("READ 작업", False, "사용자 조회 실패")
+            self.emit("   ❌ READ 작업 실패")
+            return
+        
+        self.add_test_result("READ 작업", True, "사용자 조회 성공")
+        self.emit("   ✅ READ 작업 성공")
+        
+        if failed_step == 'DELETE':
+            self.add_test_result("DELETE 작업", False, "테스트 데이터 삭제 실패")
+            self.emit("   ❌ DELETE 작업 실패")
+        else:
+            self.add_test_result("DELETE 작업", True, "테스트 데이터 정리 완료")
+            self.emit("   ✅ DELETE 작업 성공")
     
     def add_test_result(self, test_name: str, passed: bool, details: str):
-        """테스트 결과 기록"""
-        self.test_results.append({
-            'test_name': test_name,
-            'passed': passed,
-            'details': details,
-            'timestamp': datetime.now().isoformat()
-        })
-    
-    async def print_results(self):
-        """테스트 결과 출력"""
-        print("\n" + "="*60)
-        print("📊 상세 테스트 결과")
-        print("="*60)
+        """테스트 결과 기록 (출력용 행은 기록 시점에 미리 포맷)"""
+        results = _phase_results.get()
+        if results is None:
+            results = self.test_results
         
-        for i, result in enumerate(self.test_results, 1):
-            status = "✅ PASS" if result['passed'] else "❌ FAIL"
-            print(f"{i:2d}. {status} | {result['test_name']}")
-            print(f"    └─ {result['details']}")
+        self._total += 1
+        self._passed += passed
         
-        print("="*60)
-
-async def main():
-    """메인 실행 함수"""
-    print("🚀 Kiko 데이터베이스 스키마 검증 도구")
-    print("=" * 50)
+        status = "✅ PASS" if passed else "❌ FAIL"
+        results.append(CheckResult(
+            test_name=test_name,
+            passed=passed,
+            details=details,
+            t_ns=time.monotonic_ns() - self._t0_mono,
+            report_line=f" {status} | {test_name}\n    └─ {details}\n"
+        ))
     
-    # 환경 변수 확인
-    if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_ROLE_KEY:
-        print("❌ 환경 변수가 설정되지 않았습니다.")
-        print("   SUPABASE_URL과 SUPABASE_SERVICE_ROLE_KEY를 설정해주세요.")
-        return False
+    def result_timestamp(self, result: CheckResult) -> str:
+        """결과 기록 시각을 ISO 8601 문자열로 변환"""
+        return (self._t0_wall + timedelta(microseconds=result.t_ns / 1000)).isoformat()
     
-    validator = SchemaValidator()
-    success = await validator.run_all_tests()
+    def write_report(self, path: str):
+        """결과를 JSON 리포트 파일로 저장 (CI 아티팩트용, 각 결과의 t_ns는 started_at 기준 오프셋)"""
+        report = {
+            'started_at': self._t0_wall.isoformat(),
+            'passed': self._passed,
+            'total': self._total,
+            'results': self.test_results,
+        }
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
     
-    if success:
-        print("\n🎉 데이터베이스 스키마 검증 완료!")
-        print("   모든 주요 구성요소가 정상적으로 작동합니다.")
-        return True
-    else:
-        print("\n⚠️ 일부 테스트에서 문제가 발견되었습니다.")
-        print("   로그를 확인하여 문제를 해결해주세요.")
-        return False
+    async def print_results(self):
+        """테스트 결과 출력 (한 건의 로그 레코드로 출력)"""
+        separator = "=" * 60
+        logger.info(
+            "\n" + separator + "\n📊 상세 테스트 결과\n" + separator + "\n"
+            + "".join(
+                f"{i:2d}.{result.report_line}"
+                for i, result in enumerate(self.test_results, 1)
+            )
+            + separator
+        )
+
+def configure_logging() -> logging.handlers.MemoryHandler:
+    """진행 메시지를 메모리에 버퍼링하는 핸들러 구성 (flush 전까지 stdout write 없음)"""
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("%(message)s"))
+    handler = logging.handlers.MemoryHandler(
+        capacity=10_000,
+        flushLevel=logging.CRITICAL,
+        target=stream
+    )
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return handler
+
+async def main(use_cache: bool = True, report_path: Optional[str] = None):
+    """메인 실행 함수"""
+    from app.core.database import DatabaseManager
+    from app.core.config import settings
+    
+    handler = configure_logging()
+    try:
+        logger.info("🚀 Kiko 데이터베이스 스키마 검증 도구")
+        logger.info("=" * 50)
+        
+        # 환경 변수 확인
+        if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_ROLE_KEY:
+            logger.info("❌ 환경 변수가 설정되지 않았습니다.")
+            logger.info("   SUPABASE_URL과 SUPABASE_SERVICE_ROLE_KEY를 설정해주세요.")
+            return False
+        
+        validator = SchemaValidator(
+            db_cls=DatabaseManager,
+            database_url=settings.DATABASE_URL,
+            use_cache=use_cache
+        )
+        success = await validator.run_all_tests()
+        
+        if report_path:
+            validator.write_report(report_path)
+        
+        if success:
+            logger.info("\n🎉 데이터베이스 스키마 검증 완료!")
+            logger.info("   모든 주요 구성요소가 정상적으로 작동합니다.")
+            return True
+        else:
+            logger.info("\n⚠️ 일부 테스트에서 문제가 발견되었습니다.")
+            logger.info("   로그를 확인하여 문제를 해결해주세요.")
+            return False
+    finally:
+        # 예외로 중단되어도 모인 메시지는 모두 출력
+        handler.flush()
 
 if __name__ == "__main__":
-    result = asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Kiko 데이터베이스 스키마 검증")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="카탈로그 스냅샷 캐시를 무시하고 항상 다시 조회 (CI 재검증용)"
+    )
+    parser.add_argument(
+        "--report",
+        metavar="PATH",
+        help="검증 결과를 JSON 리포트로 저장할 경로"
+    )
+    args = parser.parse_args()
+    
+    result = asyncio.run(main(use_cache=not args.no_cache, report_path=args.report))
     sys.exit(0 if result else 1) 
\ No newline at end of file
@@ -60,6 +60,9 @@ class WebSocketService {
   private connectionId: string | null = null;
   private roomId: string | null = null;
 
+  // 서버는 JSON을 UTF-8 바이너리 프레임으로 전송
+  private textDecoder = new TextDecoder();
+
   // 이벤트 리스너들
   private eventListeners: Map<keyof WebSocketEventMap, Set<EventListener>> =
     new Map();
@@ -111,6 +114,7 @@ class WebSocketService {
     try {
       const wsUrl = this.buildWebSocketUrl(scriptId, authToken);
       this.ws = new WebSocket(wsUrl);
+      this.ws.binaryType = "arraybuffer";
 
       this.setupEventHandlers();
 
@@ -191,7 +195,11 @@ class WebSocketService {
    */
   private handleMessage(event: MessageEvent): void {
     try {
-      const message: WebSocketMessage = JSON.parse(event.data);
+      const raw =
+        typeof event.data === "string"
+          ? event.data
+          : this.textDecoder.decode(event.data);
+      const message: WebSocketMessage = JSON.parse(raw);
 
       logger.debug("WebSocket message received:", message);
 